@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import Literal
 
 from pydantic_settings import (
     BaseSettings,
@@ -26,12 +27,22 @@ class Settings(BaseSettings):
     POSTGRES_PASSWORD: str = 'db_pass'
     POSTGRES_USER: str = 'db_user'
 
+    """Настройки пула соединений PostgreSQL."""
+    DB_POOL_SIZE: int = 10
+    DB_POOL_MAX_OVERFLOW: int = 10
+    DB_POOL_PRE_PING: bool = True
+    DB_POOL_RECYCLE_SEC: int = 60 * 30
+    DB_POOL_TIMEOUT_SEC: int = 30
+    DB_STATEMENT_CACHE_SIZE: int = 100
+
     """Настройки базы данных Redis."""
     REDIS_HOST: str = 'redis'
     REDIS_PORT: int = 6379
     REDIS_DB_CELERY_BACKEND: int = 0
     REDIS_DB_CELERY_BROKER: int = 1
     REDIS_DB_CACHE: int = 2
+    REDIS_DB_FSM: int = 3
+    REDIS_POOL_MAX_CONNECTIONS: int = 50
 
     """Настройки SQLAlchemy Admin."""
     ADMIN_USERNAME: str = 'admin'
@@ -42,8 +53,52 @@ class Settings(BaseSettings):
     BOT_ADMIN_IDS: list[str]
     BOT_DEVELOPER_IDS: list[str]
     BOT_TOKEN: str
-    DEBUG_DB: bool = True
+    DEBUG_DB: bool = False
     DEBUG_POLL_CACHE: bool = False
+    FSM_STORAGE_REDIS: bool = False
+    FSM_STORAGE_TTL_SEC: int = 60 * 60 * 24
+
+    """Настройки рассылки опросов."""
+    POLL_SCHEDULE_MODE: Literal['day', 'minute', 'poll'] = 'minute'
+    POLL_SEND_CONCURRENCY: int = 10
+
+    """Настройки ограничения частоты запросов к Telegram Bot API."""
+    RATE_LIMIT_GLOBAL_PER_SEC: int = 30
+    RATE_LIMIT_GROUP_PER_MIN: int = 20
+    RATE_LIMIT_GROUP_BURST: int = 3
+    RATE_LIMIT_RETRY_ATTEMPTS: int = 3
+
+    """Настройки ограничения частоты обновлений от пользователей."""
+    THROTTLE_WINDOW_SEC: float = 10
+    THROTTLE_USER_LIMIT: int = 10
+    THROTTLE_ADMIN_LIMIT: int = 30
+
+    """Настройки отложенной записи активности пользователей."""
+    USER_ACTIVITY_FLUSH_INTERVAL_MS: int = 500
+    USER_ACTIVITY_FLUSH_SIZE: int = 500
+    USER_ACTIVITY_KNOWN_USERS_MAX: int = 100_000
+
+    """Настройки обработки обновлений."""
+    UPDATE_MAX_IN_FLIGHT: int = 50
+    UPDATE_QUEUE_SIZE: int = 1000
+    UPDATE_CHAT_QUEUE_SIZE: int = 10
+    UPDATE_OVERFLOW_POLICY: Literal['defer', 'shed'] = 'defer'
+    UPDATE_DRAIN_TIMEOUT_SEC: int = 10
+    UPDATE_DEDUP_TTL_SEC: int = 60 * 60
+    UPDATE_DEDUP_MAX_SIZE: int = 100_000
+    UPDATE_DEDUP_REDIS: bool = False
+
+    """Настройки многопроцессного режима (supervisor.py)."""
+    SUPERVISOR_WORKERS: int = 4
+    SUPERVISOR_QUEUE_SIZE: int = 1000
+
+    """Настройки приема обновлений через webhook."""
+    WEBHOOK_ENABLED: bool = False
+    WEBHOOK_BASE_URL: str = ''
+    WEBHOOK_PATH: str = '/webhook'
+    WEBHOOK_HOST: str = '0.0.0.0'
+    WEBHOOK_PORT: int = 8080
+    WEBHOOK_SECRET: str = ''
 
 
 settings = Settings()
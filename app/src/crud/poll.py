@@ -24,4 +24,6 @@ class PollCrud(BaseAsyncCrud):
 
 poll_crud: PollCrud = PollCrud(
     model=Poll,
+    unique_columns=('title',),
+    unique_columns_err='Опрос с таким названием уже добавлен в базу данных',
 )
@@ -1,11 +1,16 @@
 
+from sqlalchemy.dialects.postgresql import Insert as PostgresqlInsert
+from sqlalchemy.orm import aliased
 from sqlalchemy.sql import (
     delete,
     insert,
     select,
     update,
 )
-from sqlalchemy.sql.selectable import Select
+from sqlalchemy.sql.selectable import (
+    ScalarSelect,
+    Select,
+)
 
 from app.src.database.base_async_crud import (
     AsyncSession,
@@ -38,6 +43,40 @@ class UserCrud(BaseAsyncCrud):
         query: Select = select(self.model).where(self.model.id_telegram == str(obj_id_telegram))
         return (await session.execute(query)).scalars().first()
 
+    async def upsert_by_id_telegram(
+        self,
+        *,
+        obj_data: dict[str, any],
+        session: AsyncSession,
+        perform_commit: bool = True,
+    ) -> tuple[User, int | None]:
+        """
+        Создает или обновляет пользователя по id_telegram одним запросом.
+
+        Возвращает пользователя и значение message_main_last_id до обновления
+        (None для нового пользователя): подзапрос в RETURNING видит
+        состояние таблицы на момент начала запроса.
+        """
+        obj_data: dict[str, any] = self._clean_obj_data_non_model_fields(obj_data=obj_data)
+        obj_data['id_telegram'] = str(obj_data['id_telegram'])
+
+        user_previous: User = aliased(self.model)
+        message_main_last_id_previous: ScalarSelect = (
+            select(user_previous.message_main_last_id)
+            .where(user_previous.id_telegram == obj_data['id_telegram'])
+            .scalar_subquery()
+        )
+        stmt: PostgresqlInsert = (
+            self._get_upsert_stmt(obj_data=obj_data)
+            .returning(self.model, message_main_last_id_previous)
+        )
+        user, message_main_last_id = (await session.execute(stmt)).first()
+
+        if perform_commit:
+            await session.commit()
+
+        return user, message_main_last_id
+
 
 user_crud: UserCrud = UserCrud(
     model=User,
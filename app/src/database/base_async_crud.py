@@ -2,28 +2,56 @@
 Модуль базового класса асинхронных CRUD запросов в базу данных.
 """
 
+from re import (
+    Match,
+    search,
+)
+from typing import AsyncGenerator
 
+from sqlalchemy import (
+    ColumnElement,
+    Row,
+    any_,
+    literal,
+)
+from sqlalchemy.dialects.postgresql import (
+    ARRAY,
+    Insert as PostgresqlInsert,
+    insert as postgresql_insert,
+)
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncScalarResult
 from sqlalchemy.sql import (
+    cast,
+    column,
     delete,
     insert,
     select,
     update,
+    values,
 )
 from sqlalchemy.sql.dml import (
     Delete,
     Insert,
     Update,
 )
-from sqlalchemy.sql.selectable import Select
+from sqlalchemy.sql.selectable import (
+    Select,
+    Values,
+)
 
 from app.src.database.database import (
     AsyncSession,
     Base,
 )
 
+ITER_BATCH_SIZE_DEFAULT: int = 500
 PAGINATION_LIMIT_DEFAULT: int = 15
 PAGINATION_OFFSET_DEFAULT: int = 0
 
+# INFO. Код ошибки PostgreSQL нарушения ограничения уникальности.
+SQLSTATE_UNIQUE_VIOLATION: str = '23505'
+
 
 class BaseAsyncCrud():
     """Базовый класс асинхронных CRUD запросов к базе данных."""
@@ -47,32 +75,131 @@ class BaseAsyncCrud():
         perform_cleanup: bool = True,
         perform_commit: bool = True,
     ) -> Base:
-        """Создает один объект в базе данных."""
-        await self._check_unique(obj_data=obj_data, session=session)
+        """
+        Создает один объект в базе данных одним запросом INSERT ... RETURNING.
 
+        Нарушение уникальности unique_columns определяется по ошибке базы данных
+        и приводит к ValueError(unique_columns_err).
+        """
         if perform_cleanup:
             obj_data: dict[str, any] = self._clean_obj_data_non_model_fields(obj_data=obj_data)
 
         stmt: Insert = insert(self.model).values(**obj_data).returning(self.model)
-        obj: Base = (await session.execute(stmt)).scalars().first()
+        obj: Base = (
+            await self._execute_check_unique(
+                stmt=stmt,
+                session=session,
+                perform_commit=perform_commit,
+            )
+        ).scalars().first()
 
         if perform_commit:
             await session.commit()
 
         return obj
 
+    async def bulk_create(
+        self,
+        *,
+        objs_data: list[dict[str, any]],
+        session: AsyncSession,
+        perform_cleanup: bool = True,
+        perform_commit: bool = True,
+    ) -> list[Base]:
+        """
+        Создает несколько объектов в базе данных одним запросом INSERT ... RETURNING
+        (executemany). Возвращает созданные объекты в порядке objs_data.
+
+        Нарушение уникальности unique_columns приводит к ValueError(unique_columns_err),
+        при этом не создается ни один объект.
+        """
+        if not objs_data:
+            return []
+
+        if perform_cleanup:
+            objs_data: list[dict[str, any]] = [
+                self._clean_obj_data_non_model_fields(obj_data=obj_data)
+                for obj_data
+                in objs_data
+            ]
+
+        stmt: Insert = insert(self.model).returning(self.model, sort_by_parameter_order=True)
+        objs: list[Base] = (
+            await self._execute_check_unique(
+                stmt=stmt,
+                params=objs_data,
+                session=session,
+                perform_commit=perform_commit,
+            )
+        ).scalars().all()
+
+        if perform_commit:
+            await session.commit()
+
+        return objs
+
+    async def iter_all(
+        self,
+        *,
+        session: AsyncSession,
+        batch_size: int = ITER_BATCH_SIZE_DEFAULT,
+    ) -> AsyncGenerator[Base, None]:
+        """
+        Последовательно возвращает все объекты из базы данных в порядке id.
+
+        Строки читаются через серверный курсор пачками по batch_size,
+        поэтому в памяти одновременно находится не более одной пачки.
+        """
+        query: Select = (
+            select(self.model)
+            .order_by(self.model.id)
+            .execution_options(yield_per=batch_size)
+        )
+        result: AsyncScalarResult = (await session.stream(query)).scalars()
+        async for obj in result:
+            yield obj
+
     async def retrieve_all(
         self,
         *,
-        limit: int = PAGINATION_LIMIT_DEFAULT,
+        limit: int | None = PAGINATION_LIMIT_DEFAULT,
         offset: int = PAGINATION_OFFSET_DEFAULT,
+        last_id: int | None = None,
         session: AsyncSession,
     ) -> list[Base]:
-        """Получает несколько объектов из базы данных."""
-        query: Select = select(self.model).limit(limit).offset(offset)
+        """
+        Получает несколько объектов из базы данных в порядке id.
+
+        Если указан last_id, то используется keyset-пагинация:
+        возвращаются объекты с id > last_id (offset не применяется).
+        Если limit=None, то возвращаются все объекты.
+        """
+        query: Select = select(self.model).order_by(self.model.id).limit(limit)
+        if last_id is not None:
+            query: Select = query.where(self.model.id > last_id)
+        else:
+            query: Select = query.offset(offset)
         result: list[Base] = (await session.execute(query)).scalars().all()
         return result
 
+    async def retrieve_columns(
+        self,
+        *columns_names: str,
+        session: AsyncSession,
+    ) -> list[Row]:
+        """
+        Получает значения указанных колонок всех объектов из базы данных
+        в порядке id в виде кортежей (без создания объектов модели).
+
+        Например, retrieve_columns('id', 'title', session=session)
+        возвращает [(1, 'title_1'), (2, 'title_2'), ...].
+        """
+        query: Select = (
+            select(*(getattr(self.model, c) for c in columns_names))
+            .order_by(self.model.id)
+        )
+        return (await session.execute(query)).all()
+
     async def retrieve_by_id(
         self,
         *,
@@ -86,6 +213,21 @@ class BaseAsyncCrud():
             self._raise_value_error_not_found(id=obj_id)
         return result
 
+    async def retrieve_by_ids(
+        self,
+        *,
+        objs_ids: list[int],
+        session: AsyncSession,
+    ) -> list[Base]:
+        """
+        Получает несколько объектов из базы данных по списку id
+        одним запросом WHERE id = ANY(...). Отсутствующие id пропускаются.
+        """
+        if not objs_ids:
+            return []
+        query: Select = select(self.model).where(self._get_id_any_clause(objs_ids=objs_ids))
+        return (await session.execute(query)).scalars().all()
+
     async def update_by_id(
         self,
         *,
@@ -96,24 +238,133 @@ class BaseAsyncCrud():
         perform_cleanup: bool = True,
         perform_commit: bool = True,
     ) -> Base:
-        """Обновляет один объект из базы данных по указанному id."""
+        """
+        Обновляет один объект из базы данных по указанному id
+        одним запросом UPDATE ... RETURNING.
+
+        Если perform_check_unique=True, то нарушение уникальности unique_columns
+        приводит к ValueError(unique_columns_err).
+        """
         if perform_cleanup:
             obj_data: dict[str, any] = self._clean_obj_data_non_model_fields(obj_data=obj_data)
 
-        query: Select = select(self.model).where(self.model.id == obj_id)
-        if (await session.execute(query)).scalars().first() is None:
-            self._raise_value_error_not_found(id=obj_id)
-
-        if perform_check_unique:
-            await self._check_unique(obj_data=obj_data, session=session)
-
         stmt: Update = (
             update(self.model)
             .where(self.model.id == obj_id)
             .values(**obj_data)
             .returning(self.model)
         )
-        obj: Base = (await session.execute(stmt)).scalars().first()
+        if perform_check_unique:
+            obj: Base | None = (
+                await self._execute_check_unique(
+                    stmt=stmt,
+                    session=session,
+                    perform_commit=perform_commit,
+                )
+            ).scalars().first()
+        else:
+            obj: Base | None = (await session.execute(stmt)).scalars().first()
+
+        if obj is None:
+            self._raise_value_error_not_found(id=obj_id)
+
+        if perform_commit:
+            await session.commit()
+
+        return obj
+
+    async def bulk_update_by_column(
+        self,
+        *,
+        column_name: str,
+        objs_data: list[dict[str, any]],
+        session: AsyncSession,
+        column_values: dict[str, any] | None = None,
+        perform_cleanup: bool = True,
+        perform_commit: bool = True,
+    ) -> None:
+        """
+        Обновляет несколько объектов в базе данных одним запросом
+        UPDATE ... FROM (VALUES ...), сопоставляя их по колонке column_name.
+
+        Все словари objs_data должны содержать column_name и одинаковый набор колонок.
+        column_values - значения (или SQL выражения), общие для всех объектов.
+        """
+        if not objs_data:
+            return
+
+        if perform_cleanup:
+            objs_data: list[dict[str, any]] = [
+                self._clean_obj_data_non_model_fields(obj_data=obj_data)
+                for obj_data
+                in objs_data
+            ]
+
+        stmt: Update = self._get_bulk_update_stmt(
+            column_name=column_name,
+            objs_data=objs_data,
+            column_values=column_values,
+        )
+        await session.execute(stmt, execution_options={'synchronize_session': False})
+
+        if perform_commit:
+            await session.commit()
+
+    async def bulk_update_by_ids(
+        self,
+        *,
+        objs_data: list[dict[str, any]],
+        session: AsyncSession,
+        perform_cleanup: bool = True,
+        perform_commit: bool = True,
+    ) -> list[Base]:
+        """
+        Обновляет несколько объектов в базе данных по id одним запросом
+        UPDATE ... FROM (VALUES ...) ... RETURNING. Возвращает обновленные объекты.
+
+        Все словари objs_data должны содержать id и одинаковый набор колонок.
+        """
+        if not objs_data:
+            return []
+
+        if perform_cleanup:
+            objs_data: list[dict[str, any]] = [
+                self._clean_obj_data_non_model_fields(obj_data=obj_data)
+                for obj_data
+                in objs_data
+            ]
+
+        stmt: Update = self._get_bulk_update_stmt(column_name='id', objs_data=objs_data).returning(self.model)
+        objs: list[Base] = (
+            await session.execute(stmt, execution_options={'synchronize_session': False})
+        ).scalars().all()
+
+        if perform_commit:
+            await session.commit()
+
+        return objs
+
+    async def upsert(
+        self,
+        *,
+        obj_data: dict[str, any],
+        session: AsyncSession,
+        index_elements: tuple[str] | None = None,
+        perform_cleanup: bool = True,
+        perform_commit: bool = True,
+    ) -> Base:
+        """
+        Создает один объект в базе данных или обновляет существующий,
+        если объект с такими значениями index_elements уже существует
+        (INSERT ... ON CONFLICT DO UPDATE ... RETURNING).
+
+        По умолчанию index_elements - уникальные колонки модели unique_columns.
+        """
+        if perform_cleanup:
+            obj_data: dict[str, any] = self._clean_obj_data_non_model_fields(obj_data=obj_data)
+
+        stmt: PostgresqlInsert = self._get_upsert_stmt(obj_data=obj_data, index_elements=index_elements)
+        obj: Base = (await session.execute(stmt.returning(self.model))).scalars().first()
 
         if perform_commit:
             await session.commit()
@@ -136,23 +387,82 @@ class BaseAsyncCrud():
         if perform_commit:
             await session.commit()
 
-    async def _check_unique(
+    async def bulk_delete_by_ids(
         self,
         *,
-        obj_data: dict[str, any],
+        objs_ids: list[int],
         session: AsyncSession,
-    ) -> None:
-        """Проверяет уникальность переданных значений."""
+        perform_commit: bool = True,
+    ) -> list[int]:
+        """
+        Удаляет несколько объектов из базы данных по списку id
+        одним запросом DELETE ... RETURNING. Возвращает id удаленных объектов.
+        """
+        if not objs_ids:
+            return []
+
+        stmt: Delete = (
+            delete(self.model)
+            .where(self._get_id_any_clause(objs_ids=objs_ids))
+            .returning(self.model.id)
+        )
+        deleted_ids: list[int] = (
+            await session.execute(stmt, execution_options={'synchronize_session': False})
+        ).scalars().all()
+
+        if perform_commit:
+            await session.commit()
+
+        return deleted_ids
+
+    async def _execute_check_unique(
+        self,
+        *,
+        stmt: Insert | Update,
+        session: AsyncSession,
+        perform_commit: bool,
+        params: list[dict[str, any]] | None = None,
+    ) -> any:
+        """
+        Выполняет запрос и преобразует нарушение уникальности unique_columns
+        в ValueError(unique_columns_err).
+
+        Если транзакцией управляет вызывающий код (perform_commit=False),
+        то запрос выполняется в точке сохранения (SAVEPOINT),
+        чтобы ошибка не прерывала всю транзакцию.
+        """
+        try:
+            if perform_commit:
+                return await session.execute(stmt, params)
+            async with session.begin_nested():
+                return await session.execute(stmt, params)
+        except IntegrityError as err:
+            if perform_commit:
+                await session.rollback()
+            if self._is_unique_columns_violation(err=err):
+                raise ValueError(self.unique_columns_err) from err
+            raise
+
+    def _is_unique_columns_violation(self, *, err: IntegrityError) -> bool:
+        """
+        Проверяет, что ошибка базы данных - нарушение уникальности unique_columns.
+
+        Колонки определяются по детализации ошибки PostgreSQL:
+        "Key (title)=(...) already exists.".
+        """
         if self.unique_columns is None:
-            return
+            return False
 
-        conditions: list = []
-        for column_name in self.unique_columns:
-            conditions.append(getattr(self.model, column_name) == obj_data[column_name])
-        query: Select = select(self.model).filter(*conditions)
+        sqlstate: str | None = getattr(err.orig, 'sqlstate', None) or getattr(err.orig, 'pgcode', None)
+        if sqlstate != SQLSTATE_UNIQUE_VIOLATION:
+            return False
 
-        if (await session.execute(query)).scalar() is not None:
-            raise ValueError(self.unique_columns_err)
+        detail: str = getattr(err.orig, 'detail', None) or getattr(err.orig.__cause__, 'detail', None) or ''
+        match: Match[str] | None = search(r'Key \((.+?)\)=', detail)
+        if match is None:
+            # INFO. Детализация недоступна: считается, что нарушена уникальность unique_columns.
+            return True
+        return {c.strip().strip('"') for c in match.group(1).split(',')} == set(self.unique_columns)
 
     def _clean_obj_data_non_model_fields(
         self,
@@ -178,6 +488,68 @@ class BaseAsyncCrud():
             if k in model_valid_columns
         }
 
+    def _get_id_any_clause(self, *, objs_ids: list[int]) -> ColumnElement[bool]:
+        """
+        Возвращает условие id = ANY(:ids) с одним параметром-массивом
+        (вместо IN с параметром на каждый id).
+        """
+        return self.model.id == any_(literal(list(objs_ids), type_=ARRAY(self.model.id.type)))
+
+    def _get_bulk_update_stmt(
+        self,
+        *,
+        column_name: str,
+        objs_data: list[dict[str, any]],
+        column_values: dict[str, any] | None = None,
+    ) -> Update:
+        """
+        Возвращает запрос UPDATE ... FROM (VALUES ...) без RETURNING.
+        """
+        table_columns = self.model.__table__.columns
+        columns: list[str] = list(objs_data[0])
+        data: Values = (
+            values(
+                *(column(c, table_columns[c].type) for c in columns),
+                name='data',
+            )
+            .data([tuple(obj_data[c] for c in columns) for obj_data in objs_data])
+        )
+        # INFO. Колонки VALUES, состоящие только из NULL, PostgreSQL считает text,
+        #       поэтому значения явно приводятся к типу колонки модели.
+        return (
+            update(self.model)
+            .where(getattr(self.model, column_name) == data.c[column_name])
+            .values({
+                **{c: cast(data.c[c], table_columns[c].type) for c in columns if c != column_name},
+                **(column_values or {}),
+            })
+        )
+
+    def _get_upsert_stmt(
+        self,
+        *,
+        obj_data: dict[str, any],
+        index_elements: tuple[str] | None = None,
+    ) -> PostgresqlInsert:
+        """
+        Возвращает запрос INSERT ... ON CONFLICT DO UPDATE без RETURNING.
+
+        При конфликте обновляются все переданные колонки, кроме index_elements.
+        """
+        if index_elements is None:
+            index_elements: tuple[str] = self.unique_columns
+
+        stmt: PostgresqlInsert = postgresql_insert(self.model).values(**obj_data)
+        set_columns: list[str] = [k for k in obj_data if k not in index_elements]
+        if not set_columns:
+            # INFO. DO NOTHING не возвращает существующую строку в RETURNING.
+            set_columns: list[str] = list(index_elements)
+
+        return stmt.on_conflict_do_update(
+            index_elements=index_elements,
+            set_={k: stmt.excluded[k] for k in set_columns},
+        )
+
     def _raise_value_error_not_found(
         self,
         id: int | None = None,
@@ -4,7 +4,10 @@
 
 from typing import AsyncGenerator
 
-from redis import Redis
+from redis.asyncio import (
+    ConnectionPool,
+    Redis,
+)
 from sqlalchemy import create_engine
 from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy.ext.asyncio import (
@@ -15,6 +18,7 @@ from sqlalchemy.ext.asyncio import (
 )
 
 from app.src.config.config import settings
+from app.src.database.pool import MeasuredAsyncAdaptedQueuePool
 
 DATABASE_ASYNC_URL: str = f'postgresql+asyncpg://{settings.POSTGRES_USER}:{settings.POSTGRES_PASSWORD}@{settings.DB_HOST}:{settings.DB_PORT}/{settings.POSTGRES_DB}'
 DATABASE_SYNC_URL: str = f'postgresql+psycopg2://{settings.POSTGRES_USER}:{settings.POSTGRES_PASSWORD}@{settings.DB_HOST}:{settings.DB_PORT}/{settings.POSTGRES_DB}'
@@ -23,6 +27,13 @@ DATABASE_SYNC_URL: str = f'postgresql+psycopg2://{settings.POSTGRES_USER}:{setti
 async_engine: AsyncEngine = create_async_engine(
     url=DATABASE_ASYNC_URL,
     echo=settings.DEBUG_DB,
+    poolclass=MeasuredAsyncAdaptedQueuePool,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_POOL_MAX_OVERFLOW,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    pool_recycle=settings.DB_POOL_RECYCLE_SEC,
+    pool_timeout=settings.DB_POOL_TIMEOUT_SEC,
+    connect_args={'statement_cache_size': settings.DB_STATEMENT_CACHE_SIZE},
 )
 
 async_session_maker: async_sessionmaker = async_sessionmaker(
@@ -33,6 +44,8 @@ async_session_maker: async_sessionmaker = async_sessionmaker(
 sync_engine = create_engine(
     DATABASE_SYNC_URL,
     echo=settings.DEBUG_DB,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    pool_recycle=settings.DB_POOL_RECYCLE_SEC,
 )
 
 async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
@@ -70,11 +83,17 @@ class RedisKeys:
     __POLL: str = __PREFIX_SRC + 'poll_'
     POLL_ALL: str = __POLL + 'all'
 
+    # Update
+    __UPDATE: str = __PREFIX_SRC + 'update_'
+    UPDATE_SEEN_PREFIX: str = __UPDATE + 'seen_'
 
 
 redis_engine: Redis = Redis(
-    host=settings.REDIS_HOST,
-    port=settings.REDIS_PORT,
-    db=settings.REDIS_DB_CACHE,
-    decode_responses=True,
+    connection_pool=ConnectionPool(
+        host=settings.REDIS_HOST,
+        port=settings.REDIS_PORT,
+        db=settings.REDIS_DB_CACHE,
+        decode_responses=True,
+        max_connections=settings.REDIS_POOL_MAX_CONNECTIONS,
+    ),
 )
@@ -0,0 +1,55 @@
+"""
+Модуль пула соединений с базой данных с метриками.
+"""
+
+from time import perf_counter
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import (
+    AsyncAdaptedQueuePool,
+    PoolProxiedConnection,
+)
+
+
+class MeasuredAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """
+    Класс пула соединений asyncio, собирающего метрики получения соединений.
+
+    Время получения соединения включает ожидание свободного соединения,
+    создание нового соединения (в т.ч. overflow) и pre-ping.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkouts_count: int = 0
+        self.timeouts_count: int = 0
+        self.wait_sec_max: float = 0
+        self.wait_sec_total: float = 0
+
+    def connect(self) -> PoolProxiedConnection:
+        started_at: float = perf_counter()
+        try:
+            return super().connect()
+        except PoolTimeoutError:
+            self.timeouts_count += 1
+            raise
+        finally:
+            wait_sec: float = perf_counter() - started_at
+            self.checkouts_count += 1
+            self.wait_sec_total += wait_sec
+            self.wait_sec_max = max(self.wait_sec_max, wait_sec)
+
+    def get_metrics(self) -> dict[str, int | float]:
+        """
+        Возвращает метрики пула соединений.
+        """
+        return {
+            'size': self.size(),
+            'checked_out': self.checkedout(),
+            'checked_in': self.checkedin(),
+            'overflow': max(self.overflow(), 0),
+            'checkouts_count': self.checkouts_count,
+            'timeouts_count': self.timeouts_count,
+            'wait_ms_avg': round(self.wait_sec_total / self.checkouts_count * 1000, 2) if self.checkouts_count else 0,
+            'wait_ms_max': round(self.wait_sec_max * 1000, 2),
+        }
@@ -6,14 +6,18 @@ from sys import path as sys_path
 #       использования абсолютных путей импорта данных из модулей.
 sys_path.append(os_path.abspath(os_path.join(os_path.dirname(__file__), '../..')))
 
-from app.src.telegram_bot.bot import bot
-from app.src.telegram_bot.dispatcher import dp
+from app.src.config.config import settings
+from app.src.telegram_bot.polling import run_polling
+from app.src.telegram_bot.webhook import run_webhook
 from app.src.scheduler.scheduler import scheduler
 
 
 async def main() -> None:
     scheduler.start()
-    await dp.start_polling(bot)
+    if settings.WEBHOOK_ENABLED:
+        await run_webhook()
+    else:
+        await run_polling()
 
 
 if __name__ == '__main__':
@@ -45,6 +45,7 @@ class Poll(Base):
     chat_id: Mapped[str] = mapped_column(
         String(length=PollParams.CHAT_ID_LEN_MAX),
         comment='id чата/группы Telegram',
+        index=True,
     )
     dates_skip: Mapped[list[str]] = mapped_column(
         ARRAY(String(length=PollParams.SKIP_DATE_LEN_MAX)),
@@ -89,12 +90,16 @@ class Poll(Base):
     send_time: Mapped[time] = mapped_column(
         Time(),
         comment='время для отправки',
+        index=True,
     )
     title: Mapped[str] = mapped_column(
         String(length=PollParams.TITLE_LEN_MAX),
+        index=True,
+        unique=True,
     )
     user_id_telegram: Mapped[int] = mapped_column(
         comment='id пользователя Telegram, кто отправил опрос',
+        index=True,
     )
 
     def to_dict_repr(
@@ -0,0 +1,185 @@
+"""
+Модуль хранилища задач APScheduler с отложенной записью в базу данных.
+"""
+
+import pickle
+from queue import (
+    Empty,
+    Queue,
+)
+from threading import (
+    Event,
+    Thread,
+)
+from time import sleep
+
+from apscheduler.job import Job
+from apscheduler.jobstores.memory import MemoryJobStore
+from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
+from apscheduler.util import datetime_to_utc_timestamp
+from sqlalchemy import Engine
+from sqlalchemy.dialects.postgresql import insert
+
+# INFO. Максимальное количество операций, записываемых одной транзакцией.
+WRITE_BATCH_SIZE: int = 500
+# INFO. Начальная и максимальная задержка повторной записи операций после ошибки.
+WRITE_RETRY_DELAY_SEC: float = 1
+WRITE_RETRY_DELAY_MAX_SEC: float = 60
+# INFO. Количество попыток записи операций при остановке scheduler.
+WRITE_STOP_ATTEMPTS: int = 3
+
+
+class WriteBehindJobStore(MemoryJobStore):
+    """
+    Класс хранилища задач APScheduler в памяти с отложенной записью
+    в таблицу apscheduler_jobs.
+
+    Задачи загружаются из базы данных один раз при запуске scheduler.
+    Все чтения (get_jobs, get_due_jobs, ...) выполняются из памяти,
+    а изменения ставятся в очередь и записываются в базу данных
+    фоновым потоком, поэтому не блокируют цикл событий asyncio.
+    Если запись не удалась, те же операции записываются повторно с растущей
+    задержкой до WRITE_RETRY_DELAY_MAX_SEC, следующие операции ждут в очереди.
+    При остановке scheduler очередь записывается полностью (не более
+    WRITE_STOP_ATTEMPTS попыток на пачку, затем изменения теряются).
+    """
+
+    def __init__(
+        self,
+        *,
+        engine: Engine,
+        pickle_protocol: int = pickle.HIGHEST_PROTOCOL,
+    ):
+        super().__init__()
+        self.pickle_protocol: int = pickle_protocol
+        self._persistent: SQLAlchemyJobStore = SQLAlchemyJobStore(
+            engine=engine,
+            pickle_protocol=pickle_protocol,
+        )
+        # INFO. Операции: (job_id, next_run_time, job_state) - сохранить задачу,
+        #       (job_id, None, None) - удалить задачу, (None, None, None) - удалить все задачи.
+        self._queue: Queue[tuple[str | None, float | None, bytes | None] | None] = Queue()
+        self._stopping: Event = Event()
+        self._thread: Thread | None = None
+
+    def start(self, scheduler, alias: str) -> None:
+        super().start(scheduler, alias)
+        self._persistent.start(scheduler, alias)
+        for job in self._persistent.get_all_jobs():
+            super().add_job(job)
+
+        self._thread = Thread(target=self.__run, name='apscheduler-jobstore-writer', daemon=True)
+        self._thread.start()
+
+    def add_job(self, job: Job) -> None:
+        super().add_job(job)
+        self.__put_save(job=job)
+
+    def update_job(self, job: Job) -> None:
+        super().update_job(job)
+        self.__put_save(job=job)
+
+    def remove_job(self, job_id: str) -> None:
+        super().remove_job(job_id)
+        self._queue.put((job_id, None, None))
+
+    def remove_all_jobs(self) -> None:
+        super().remove_all_jobs()
+        self._queue.put((None, None, None))
+
+    def shutdown(self) -> None:
+        """Записывает оставшиеся изменения и закрывает соединения с базой данных."""
+        if self._thread is not None:
+            self._stopping.set()
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+        self._persistent.shutdown()
+        super().shutdown()
+
+    def __put_save(self, job: Job) -> None:
+        """
+        Ставит в очередь сохранение задачи.
+
+        Состояние задачи сериализуется сразу, чтобы последующие изменения
+        объекта Job не попали в уже поставленную операцию.
+        """
+        self._queue.put(
+            (
+                job.id,
+                datetime_to_utc_timestamp(job.next_run_time),
+                pickle.dumps(job.__getstate__(), self.pickle_protocol),
+            ),
+        )
+
+    def __run(self) -> None:
+        """Записывает операции из очереди в базу данных пачками до WRITE_BATCH_SIZE."""
+        is_stopped: bool = False
+        while not is_stopped:
+            operations: list[tuple[str | None, float | None, bytes | None]] = []
+            operation: tuple | None = self._queue.get()
+            while True:
+                if operation is None:
+                    is_stopped = True
+                    break
+                operations.append(operation)
+                if len(operations) >= WRITE_BATCH_SIZE:
+                    break
+                try:
+                    operation = self._queue.get_nowait()
+                except Empty:
+                    break
+
+            if operations:
+                self.__write_with_retry(operations=operations)
+
+    def __write_with_retry(self, operations: list[tuple[str | None, float | None, bytes | None]]) -> None:
+        """
+        Записывает операции в базу данных, повторяя запись после ошибки.
+
+        После остановки scheduler выполняется не более WRITE_STOP_ATTEMPTS
+        попыток, после чего операции отбрасываются.
+        """
+        delay_sec: float = WRITE_RETRY_DELAY_SEC
+        stop_attempts: int = 0
+        while True:
+            try:
+                self.__write(operations=operations)
+                return
+            except Exception:
+                if self._stopping.is_set():
+                    stop_attempts += 1
+                    if stop_attempts >= WRITE_STOP_ATTEMPTS:
+                        self._logger.exception(
+                            'Не удалось записать %s изменений задач при остановке, изменения потеряны',
+                            len(operations),
+                        )
+                        return
+                self._logger.exception('Не удалось записать %s изменений задач, повтор', len(operations))
+
+            # INFO. Ожидание прерывается при остановке scheduler,
+            #       чтобы она не ждала WRITE_RETRY_DELAY_MAX_SEC.
+            if self._stopping.is_set():
+                sleep(WRITE_RETRY_DELAY_SEC)
+            else:
+                self._stopping.wait(delay_sec)
+            delay_sec = min(delay_sec * 2, WRITE_RETRY_DELAY_MAX_SEC)
+
+    def __write(self, operations: list[tuple[str | None, float | None, bytes | None]]) -> None:
+        """Записывает операции в базу данных одной транзакцией в порядке их поступления."""
+        jobs_t = self._persistent.jobs_t
+        with self._persistent.engine.begin() as connection:
+            for job_id, next_run_time, job_state in operations:
+                if job_id is None:
+                    connection.execute(jobs_t.delete())
+                elif job_state is None:
+                    connection.execute(jobs_t.delete().where(jobs_t.c.id == job_id))
+                else:
+                    connection.execute(
+                        insert(jobs_t)
+                        .values(id=job_id, next_run_time=next_run_time, job_state=job_state)
+                        .on_conflict_do_update(
+                            index_elements=(jobs_t.c.id,),
+                            set_={'next_run_time': next_run_time, 'job_state': job_state},
+                        ),
+                    )
@@ -1,10 +1,10 @@
 from apscheduler.executors.asyncio import AsyncIOExecutor
-from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
 from app.src.database.database import sync_engine
+from app.src.scheduler.jobstore import WriteBehindJobStore
 
 scheduler: AsyncIOScheduler = AsyncIOScheduler(
     executors={'default': AsyncIOExecutor()},
-    jobstores={'default': SQLAlchemyJobStore(engine=sync_engine)},
+    jobstores={'default': WriteBehindJobStore(engine=sync_engine)},
 )
@@ -0,0 +1,278 @@
+"""
+Многопроцессный режим работы бота.
+
+Процесс supervisor получает обновления от Telegram (long polling) и распределяет
+их по N рабочим процессам, в каждом из которых работает свой Dispatcher:
+    - обновления одного чата всегда попадают в один и тот же процесс
+      (chat_id % N), поэтому шаги форм (FSM) пользователя обрабатываются по порядку
+    - процесс с индексом 0 (лидер) единственный запускает scheduler,
+      поэтому ему же передаются все обновления администраторов и разработчиков:
+      их обработчики изменяют задачи scheduler
+
+Запуск вместо main.py:
+    python src/supervisor.py
+"""
+
+import logging
+from asyncio import (
+    AbstractEventLoop,
+    get_running_loop,
+    run as asyncio_run,
+)
+from functools import partial
+from multiprocessing import (
+    Process,
+    Queue,
+    Value,
+)
+from multiprocessing.sharedctypes import Synchronized
+from os import path as os_path
+from queue import Full
+from signal import (
+    SIG_IGN,
+    SIGINT,
+    SIGTERM,
+    signal,
+)
+from sys import path as sys_path
+
+# INFO: добавляет корневую директорию проекта в sys.path для возможности
+#       использования абсолютных путей импорта данных из модулей.
+sys_path.append(os_path.abspath(os_path.join(os_path.dirname(__file__), '../..')))
+
+from aiogram.dispatcher.middlewares.user_context import (
+    EventContext,
+    UserContextMiddleware,
+)
+from aiogram.types import Update
+
+from app.src.config.config import settings
+from app.src.scheduler.scheduler import scheduler
+from app.src.telegram_bot.bot import (
+    bot,
+    rate_limit_middleware,
+)
+from app.src.telegram_bot.dispatcher import dp
+from app.src.telegram_bot.lifecycle import (
+    listen_updates,
+    run_until_stop_signal,
+)
+from app.src.telegram_bot.middlewares.rate_limit import TokenBucket
+from app.src.telegram_bot.processor import update_processor
+from app.src.utils.course import course_catalog
+
+# INFO. Индекс процесса, который запускает scheduler.
+LEADER_WORKER_INDEX: int = 0
+# INFO. Время ожидания завершения рабочих процессов при остановке.
+WORKER_STOP_TIMEOUT_SEC: int = 30
+# INFO. Время ожидания места в очереди рабочего процесса,
+#       после которого проверяется, что процесс не завершился.
+QUEUE_PUT_TIMEOUT_SEC: int = 1
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+def get_update_worker_index(
+    update: Update,
+    workers: int,
+    leader_user_ids: frozenset[int],
+) -> int:
+    """
+    Возвращает индекс рабочего процесса для обновления.
+
+    Обновления администраторов и разработчиков, а также обновления
+    без чата и пользователя обрабатывает лидер, остальные распределяются
+    по chat_id (или по ID пользователя, если чата нет).
+    """
+    context: EventContext = UserContextMiddleware.resolve_event_context(event=update)
+    if context.user is not None and context.user.id in leader_user_ids:
+        return LEADER_WORKER_INDEX
+    if context.chat is not None:
+        return context.chat.id % workers
+    if context.user is not None:
+        return context.user.id % workers
+    return LEADER_WORKER_INDEX
+
+
+def run_worker(
+    index: int,
+    workers: int,
+    updates_queue: Queue,
+    catalog_version: Synchronized,
+) -> None:
+    """
+    Точка входа рабочего процесса.
+    """
+    # INFO. Остановкой рабочих процессов управляет supervisor.
+    signal(SIGINT, SIG_IGN)
+    signal(SIGTERM, SIG_IGN)
+    asyncio_run(
+        __worker_main(
+            index=index,
+            workers=workers,
+            updates_queue=updates_queue,
+            catalog_version=catalog_version,
+        ),
+    )
+
+
+async def __worker_main(
+    index: int,
+    workers: int,
+    updates_queue: Queue,
+    catalog_version: Synchronized,
+) -> None:
+    """
+    Передает обновления из очереди рабочего процесса
+    в update_processor до получения None.
+    """
+    # INFO. Общий лимит исходящих запросов к Telegram Bot API
+    #       делится между всеми рабочими процессами.
+    global_per_sec: float = settings.RATE_LIMIT_GLOBAL_PER_SEC / workers
+    rate_limit_middleware.global_bucket = TokenBucket(capacity=global_per_sec, rate=global_per_sec)
+    course_catalog.share_version(shared_version=catalog_version)
+    if index == LEADER_WORKER_INDEX:
+        scheduler.start()
+
+    loop: AbstractEventLoop = get_running_loop()
+    await dp.emit_startup(bot=bot, dispatcher=dp)
+    try:
+        while True:
+            update: dict[str, any] | None = await loop.run_in_executor(None, updates_queue.get)
+            if update is None:
+                break
+            await update_processor.submit(update=Update.model_validate(update, context={'bot': bot}))
+    finally:
+        await dp.emit_shutdown(bot=bot, dispatcher=dp)
+        await bot.session.close()
+
+
+class Supervisor:
+    """
+    Класс управления рабочими процессами бота.
+
+    Получает обновления и кладет их в очередь рабочего процесса
+    (см. get_update_worker_index). Очереди ограничены SUPERVISOR_QUEUE_SIZE:
+    если процесс не успевает обрабатывать обновления, получение новых
+    обновлений приостанавливается. Завершившийся процесс перезапускается.
+    """
+
+    def __init__(self, *, workers: int, queue_size: int):
+        self.workers: int = workers
+        self._catalog_version: Synchronized = Value('q', 0)
+        self._leader_user_ids: frozenset[int] = frozenset(
+            int(i) for i in (*settings.BOT_ADMIN_IDS, *settings.BOT_DEVELOPER_IDS)
+        )
+        self._processes: list[Process | None] = [None] * workers
+        self._queues: list[Queue] = [Queue(maxsize=queue_size) for _ in range(workers)]
+
+    def start(self) -> None:
+        """Запускает рабочие процессы."""
+        for index in range(self.workers):
+            self.__start_worker(index=index)
+
+    def stop(self) -> None:
+        """
+        Дожидается обработки полученных обновлений и останавливает рабочие процессы.
+
+        Процесс, в очередь которого не удалось передать сигнал остановки
+        (процесс завис или завершился с заполненной очередью), или который
+        не завершился за WORKER_STOP_TIMEOUT_SEC секунд, завершается принудительно.
+        """
+        for queue, process in zip(self._queues, self._processes):
+            try:
+                queue.put(None, timeout=WORKER_STOP_TIMEOUT_SEC if process.is_alive() else 0)
+            except Full:
+                logger.warning('Очередь рабочего процесса %s заполнена, остановка', process.name)
+                process.terminate()
+        for process in self._processes:
+            process.join(timeout=WORKER_STOP_TIMEOUT_SEC)
+            if process.is_alive():
+                logger.warning('Рабочий процесс %s не завершился, остановка', process.name)
+                process.terminate()
+                process.join(timeout=WORKER_STOP_TIMEOUT_SEC)
+        # INFO. Читателей очередей больше нет: выход supervisor не должен ждать
+        #       передачи оставшихся в очередях обновлений.
+        for queue in self._queues:
+            queue.cancel_join_thread()
+
+    async def poll(self) -> None:
+        """
+        Получает обновления от Telegram и распределяет их по рабочим процессам.
+        """
+        async for update in listen_updates():
+            self.__restart_dead_workers()
+            index: int = get_update_worker_index(
+                update=update,
+                workers=self.workers,
+                leader_user_ids=self._leader_user_ids,
+            )
+            await self.__put(
+                index=index,
+                update=update.model_dump(mode='json', exclude_unset=True, by_alias=True),
+            )
+
+    async def __put(self, index: int, update: dict[str, any]) -> None:
+        """
+        Кладет обновление в очередь рабочего процесса, дожидаясь места в ней.
+
+        Место ожидается частями по QUEUE_PUT_TIMEOUT_SEC секунд: между ними
+        завершившийся процесс перезапускается, а отмена задачи прерывает ожидание.
+        """
+        loop: AbstractEventLoop = get_running_loop()
+        while True:
+            try:
+                await loop.run_in_executor(
+                    None,
+                    partial(self._queues[index].put, update, timeout=QUEUE_PUT_TIMEOUT_SEC),
+                )
+                return
+            except Full:
+                self.__restart_dead_workers()
+
+    def __restart_dead_workers(self) -> None:
+        """Перезапускает завершившиеся рабочие процессы."""
+        for index, process in enumerate(self._processes):
+            if not process.is_alive():
+                logger.error('Рабочий процесс %s завершился (код %s), перезапуск', process.name, process.exitcode)
+                self.__start_worker(index=index)
+
+    def __start_worker(self, index: int) -> None:
+        """Запускает рабочий процесс с указанным индексом."""
+        process: Process = Process(
+            target=run_worker,
+            kwargs={
+                'index': index,
+                'workers': self.workers,
+                'updates_queue': self._queues[index],
+                'catalog_version': self._catalog_version,
+            },
+            name=f'bot-worker-{index}',
+        )
+        process.start()
+        self._processes[index] = process
+
+
+async def main(supervisor: Supervisor) -> None:
+    """
+    Получает обновления до остановки процесса (SIGINT или SIGTERM).
+    """
+    try:
+        await run_until_stop_signal(supervisor.poll())
+    finally:
+        await bot.session.close()
+
+
+if __name__ == '__main__':
+    supervisor: Supervisor = Supervisor(
+        workers=settings.SUPERVISOR_WORKERS,
+        queue_size=settings.SUPERVISOR_QUEUE_SIZE,
+    )
+    # INFO. Рабочие процессы запускаются до создания цикла событий supervisor.
+    supervisor.start()
+    try:
+        asyncio_run(main(supervisor=supervisor))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        supervisor.stop()
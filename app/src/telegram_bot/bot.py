@@ -1,5 +1,14 @@
 from aiogram import Bot
 
 from app.src.config.config import settings
+from app.src.telegram_bot.middlewares.rate_limit import RateLimitMiddleware
+
+rate_limit_middleware: RateLimitMiddleware = RateLimitMiddleware(
+    global_per_sec=settings.RATE_LIMIT_GLOBAL_PER_SEC,
+    group_per_min=settings.RATE_LIMIT_GROUP_PER_MIN,
+    group_burst=settings.RATE_LIMIT_GROUP_BURST,
+    retry_attempts=settings.RATE_LIMIT_RETRY_ATTEMPTS,
+)
 
 bot: Bot = Bot(token=settings.BOT_TOKEN)
+bot.session.middleware(rate_limit_middleware)
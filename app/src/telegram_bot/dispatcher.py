@@ -1,23 +1,76 @@
+from functools import partial
+from json import dumps as json_dumps
+
 from aiogram import (
     Dispatcher,
     Router,
 )
+from aiogram.fsm.storage.base import BaseStorage
 from aiogram.fsm.storage.memory import MemoryStorage
+from aiogram.fsm.storage.redis import (
+    DefaultKeyBuilder,
+    RedisStorage,
+)
+from redis.asyncio import Redis
 
+from app.src.config.config import settings
+from app.src.database.database import async_session_maker
+from app.src.scheduler.scheduler import scheduler
+from app.src.telegram_bot.bot import bot
+from app.src.telegram_bot.middlewares.db_session import DbSessionMiddleware
+from app.src.telegram_bot.middlewares.dedup import dedup_middleware
+from app.src.telegram_bot.middlewares.throttling import throttling_middleware
+from app.src.telegram_bot.processor import update_processor
 from app.src.telegram_bot.routers.chat_control import router as chat_control
 from app.src.telegram_bot.routers.course_add import router as course_add
 from app.src.telegram_bot.routers.course_main import router as course_main
 from app.src.telegram_bot.routers.course_my import router as course_my
 from app.src.telegram_bot.routers.fallback import router as _fallback
+from app.src.telegram_bot.routers.metrics import router as metrics
 from app.src.telegram_bot.routers.poll_add import router as poll_add
 from app.src.telegram_bot.routers.poll_my import router as poll_my
 from app.src.telegram_bot.routers.redis_clear import router as redis_clear
 from app.src.telegram_bot.routers.start import router as start
 from app.src.telegram_bot.routers.sync_poll_schedule import router as sync_poll_schedule
+from app.src.utils.course import course_catalog
+from app.src.utils.message import message_cleanup_queue
+from app.src.utils.poll import sync_poll_schedule_jobs
+from app.src.utils.user import user_activity_buffer
+
+
+def create_fsm_storage() -> BaseStorage:
+    """
+    Создает хранилище состояний FSM.
+
+    Если FSM_STORAGE_REDIS=True, то состояния форм хранятся в Redis
+    и доступны всем процессам бота, иначе - в памяти текущего процесса.
+    Данные форм сериализуются в компактный JSON без экранирования кириллицы.
+    """
+    if not settings.FSM_STORAGE_REDIS:
+        return MemoryStorage()
+
+    return RedisStorage(
+        redis=Redis(
+            host=settings.REDIS_HOST,
+            port=settings.REDIS_PORT,
+            db=settings.REDIS_DB_FSM,
+        ),
+        key_builder=DefaultKeyBuilder(prefix='fsm'),
+        state_ttl=settings.FSM_STORAGE_TTL_SEC,
+        data_ttl=settings.FSM_STORAGE_TTL_SEC,
+        json_dumps=partial(json_dumps, ensure_ascii=False, separators=(',', ':')),
+    )
+
 
 dp: Dispatcher = Dispatcher(
-    storage=MemoryStorage(),
+    storage=create_fsm_storage(),
 )
+# WARNING! dedup_middleware и throttling_middleware должны быть зарегистрированы
+#          раньше DbSessionMiddleware: отброшенные обновления не должны занимать
+#          соединение с базой данных, а повторные - расходовать лимит пользователя.
+dp.update.outer_middleware(dedup_middleware)
+dp.update.outer_middleware(throttling_middleware)
+dp.update.outer_middleware(DbSessionMiddleware(session_maker=async_session_maker))
 
 routers: list[Router] = (
     chat_control,
@@ -25,6 +78,7 @@ routers: list[Router] = (
     course_my,
     poll_add,
     course_main,
+    metrics,
     poll_my,
     redis_clear,
     start,
@@ -34,3 +88,31 @@ routers: list[Router] = (
 )
 for router in routers:
     dp.include_router(router)
+
+
+@dp.startup()
+async def on_startup() -> None:
+    """
+    Запускает фоновые задачи бота и прием обновлений.
+    """
+    message_cleanup_queue.start()
+    user_activity_buffer.start()
+    await course_catalog.load()
+    # INFO. Переносит задачи отправки опросов в текущий режим POLL_SCHEDULE_MODE.
+    if scheduler.running:
+        await sync_poll_schedule_jobs()
+    update_processor.start(dispatcher=dp, bot=bot)
+
+
+@dp.shutdown()
+async def on_shutdown() -> None:
+    """
+    Дожидается обработки принятых обновлений,
+    останавливает фоновые задачи бота и сохраняет накопленные данные.
+    """
+    await update_processor.drain(timeout_sec=settings.UPDATE_DRAIN_TIMEOUT_SEC)
+    await user_activity_buffer.stop()
+    await message_cleanup_queue.stop()
+    # INFO. Записывает в базу данных отложенные изменения задач scheduler.
+    if scheduler.running:
+        scheduler.shutdown(wait=False)
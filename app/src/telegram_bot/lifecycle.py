@@ -0,0 +1,102 @@
+"""
+Модуль управления жизненным циклом процесса бота.
+"""
+
+import logging
+from asyncio import (
+    AbstractEventLoop,
+    CancelledError,
+    Task,
+    create_task,
+    current_task,
+    get_running_loop,
+)
+from signal import (
+    SIGINT,
+    SIGTERM,
+)
+from typing import (
+    AsyncGenerator,
+    Coroutine,
+)
+
+from aiogram.exceptions import (
+    TelegramNetworkError,
+    TelegramRetryAfter,
+    TelegramServerError,
+)
+from aiogram.types import Update
+from aiogram.utils.backoff import (
+    Backoff,
+    BackoffConfig,
+)
+
+from app.src.telegram_bot.bot import bot
+from app.src.telegram_bot.dispatcher import dp
+
+# INFO. Сигналы, по которым процесс бота останавливается штатно.
+STOP_SIGNALS: tuple[int, ...] = (SIGINT, SIGTERM)
+# INFO. Время ожидания новых обновлений одним запросом getUpdates.
+POLLING_TIMEOUT_SEC: int = 30
+# INFO. Задержка повторного запроса обновлений после ошибки сети или Telegram.
+POLLING_BACKOFF_CONFIG: BackoffConfig = BackoffConfig(min_delay=1, max_delay=60, factor=2, jitter=0.1)
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+async def run_until_stop_signal(coro: Coroutine) -> None:
+    """
+    Выполняет coro до завершения или до сигнала остановки процесса (SIGINT, SIGTERM).
+
+    По сигналу coro отменяется, а управление возвращается вызывающему коду,
+    поэтому его блоки finally (остановка dp, запись накопленных данных)
+    выполняются и при "docker stop".
+    """
+    loop: AbstractEventLoop = get_running_loop()
+    task: Task = create_task(coro)
+    for stop_signal in STOP_SIGNALS:
+        loop.add_signal_handler(stop_signal, task.cancel)
+    try:
+        await task
+    except CancelledError:
+        # INFO. Отмена самой вызывающей задачи должна передаваться дальше.
+        if current_task().cancelling():
+            raise
+    finally:
+        for stop_signal in STOP_SIGNALS:
+            loop.remove_signal_handler(stop_signal)
+
+
+async def listen_updates() -> AsyncGenerator[Update, None]:
+    """
+    Получает обновления от Telegram через long polling.
+
+    Используется вместо dp.start_polling, чтобы обработку обновлений
+    ограничивал вызывающий код (update_processor, supervisor).
+    Полученные обновления подтверждаются параметром offset следующего запроса.
+    При ошибках сети или Telegram запрос повторяется с растущей задержкой.
+    """
+    backoff: Backoff = Backoff(config=POLLING_BACKOFF_CONFIG)
+    allowed_updates: list[str] = dp.resolve_used_update_types()
+    # INFO. Ожидание ответа должно быть дольше POLLING_TIMEOUT_SEC,
+    #       иначе пустой ответ long polling завершится по таймауту сессии.
+    request_timeout: int = int(bot.session.timeout + POLLING_TIMEOUT_SEC)
+    offset: int | None = None
+    while True:
+        try:
+            updates: list[Update] = await bot.get_updates(
+                offset=offset,
+                timeout=POLLING_TIMEOUT_SEC,
+                allowed_updates=allowed_updates,
+                request_timeout=request_timeout,
+            )
+        except (TelegramNetworkError, TelegramRetryAfter, TelegramServerError) as err:
+            logger.warning('Не удалось получить обновления (%s), повтор через %.1f сек.', err, backoff.next_delay)
+            await backoff.asleep()
+            continue
+        backoff.reset()
+
+        update: Update
+        for update in updates:
+            yield update
+            offset = update.update_id + 1
@@ -0,0 +1,49 @@
+"""
+Модуль промежуточного слоя сессии базы данных для обработки обновлений.
+"""
+
+from typing import (
+    Awaitable,
+    Callable,
+)
+
+from aiogram import BaseMiddleware
+from aiogram.types import TelegramObject
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+)
+
+
+class DbSessionMiddleware(BaseMiddleware):
+    """
+    Промежуточный слой сессии базы данных.
+
+    Каждое обновление получает одну сессию AsyncSession, которая передается
+    обработчикам в аргументе session. Соединение берется из пула только
+    при первом запросе к базе данных, поэтому обновления без запросов
+    соединение не занимают. Незавершенная транзакция фиксируется
+    после успешной обработки и откатывается при ошибке.
+
+    Соединение возвращается в пул только после завершения транзакции,
+    поэтому обработчики завершают ее (commit или rollback) до запросов
+    к Telegram Bot API: запросы CRUD на запись фиксируют транзакцию сами,
+    после чтения и после ошибки записи транзакция завершается явно.
+    """
+
+    def __init__(self, *, session_maker: async_sessionmaker):
+        self.session_maker: async_sessionmaker = session_maker
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, dict[str, any]], Awaitable[any]],
+        event: TelegramObject,
+        data: dict[str, any],
+    ) -> any:
+        session: AsyncSession
+        async with self.session_maker() as session:
+            data['session'] = session
+            result: any = await handler(event, data)
+            if session.in_transaction():
+                await session.commit()
+            return result
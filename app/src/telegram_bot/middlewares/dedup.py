@@ -0,0 +1,114 @@
+"""
+Модуль промежуточного слоя защиты от повторной обработки обновлений.
+"""
+
+import logging
+from collections import OrderedDict
+from time import monotonic
+from typing import (
+    Awaitable,
+    Callable,
+)
+
+from aiogram import BaseMiddleware
+from aiogram.types import Update
+from redis.exceptions import RedisError
+
+from app.src.config.config import settings
+from app.src.database.database import (
+    RedisKeys,
+    redis_engine,
+)
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class DedupMiddleware(BaseMiddleware):
+    """
+    Промежуточный слой защиты от повторной обработки обновлений.
+
+    Telegram доставляет обновления "хотя бы один раз": при повторе запроса
+    webhook или нескольких процессах получения обновлений одно и то же
+    обновление может прийти повторно. ID обработанных обновлений хранятся
+    ttl_sec секунд (не более max_size в памяти процесса), повторные
+    обновления отбрасываются до роутеров.
+
+    Если use_redis=True, то ID дополнительно фиксируются в Redis
+    через SET NX EX, и повтор отбрасывается во всех экземплярах бота.
+    При недоступности Redis обновление обрабатывается.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_sec: int,
+        max_size: int,
+        use_redis: bool,
+    ):
+        self.dropped_count: int = 0
+        self.max_size: int = max_size
+        self.ttl_sec: int = ttl_sec
+        self.use_redis: bool = use_redis
+        self._seen: OrderedDict[int, float] = OrderedDict()
+
+    async def __call__(
+        self,
+        handler: Callable[[Update, dict[str, any]], Awaitable[any]],
+        event: Update,
+        data: dict[str, any],
+    ) -> any:
+        if (
+            self.__is_seen_local(update_id=event.update_id)
+            or await self.__is_seen_redis(update_id=event.update_id)
+        ):
+            self.dropped_count += 1
+            return
+        return await handler(event, data)
+
+    def get_metrics(self) -> dict[str, int]:
+        """
+        Возвращает метрики защиты от повторной обработки обновлений.
+        """
+        return {
+            'seen': len(self._seen),
+            'dropped_count': self.dropped_count,
+        }
+
+    def __is_seen_local(self, update_id: int) -> bool:
+        """
+        Проверяет, было ли обновление в памяти процесса, и запоминает его.
+        """
+        now: float = monotonic()
+        # INFO. Время хранения одинаковое, поэтому ID упорядочены по времени истечения.
+        while self._seen and (next(iter(self._seen.values())) <= now or len(self._seen) >= self.max_size):
+            self._seen.popitem(last=False)
+
+        if update_id in self._seen:
+            return True
+        self._seen[update_id] = now + self.ttl_sec
+        return False
+
+    async def __is_seen_redis(self, update_id: int) -> bool:
+        """
+        Проверяет, было ли обновление в Redis, и запоминает его.
+        """
+        if not self.use_redis:
+            return False
+        try:
+            is_set: bool | None = await redis_engine.set(
+                name=f'{RedisKeys.UPDATE_SEEN_PREFIX}{update_id}',
+                value=1,
+                nx=True,
+                ex=self.ttl_sec,
+            )
+        except RedisError as err:
+            logger.error('Не удалось проверить обновление %s в Redis: %s', update_id, err)
+            return False
+        return not is_set
+
+
+dedup_middleware: DedupMiddleware = DedupMiddleware(
+    ttl_sec=settings.UPDATE_DEDUP_TTL_SEC,
+    max_size=settings.UPDATE_DEDUP_MAX_SIZE,
+    use_redis=settings.UPDATE_DEDUP_REDIS,
+)
@@ -0,0 +1,154 @@
+"""
+Модуль ограничения частоты исходящих запросов к Telegram Bot API.
+"""
+
+from asyncio import (
+    Lock,
+    sleep,
+)
+from time import monotonic
+
+from aiogram import Bot
+from aiogram.client.session.middlewares.base import (
+    BaseRequestMiddleware,
+    NextRequestMiddlewareType,
+)
+from aiogram.exceptions import TelegramRetryAfter
+from aiogram.methods import (
+    Response,
+    TelegramMethod,
+)
+from aiogram.methods.base import TelegramType
+
+# INFO. Количество корзин групп, после которого удаляются неиспользуемые.
+GROUP_BUCKETS_PRUNE_SIZE: int = 1000
+
+
+class TokenBucket:
+    """
+    Класс представления корзины токенов.
+
+    Корзина вмещает capacity токенов и пополняется со скоростью rate токенов
+    в секунду. Ожидающие токен запросы обслуживаются в порядке очереди.
+    До момента blocked_until (см. block) токены не выдаются.
+    """
+
+    def __init__(self, *, capacity: float, rate: float):
+        self.blocked_until: float = 0
+        self.capacity: float = capacity
+        self.rate: float = rate
+        self.waiting: int = 0
+        self._lock: Lock = Lock()
+        self._tokens: float = capacity
+        self._updated_at: float = monotonic()
+
+    async def acquire(self) -> None:
+        """Дожидается и забирает один токен."""
+        self.waiting += 1
+        try:
+            async with self._lock:
+                while True:
+                    blocked_sec: float = self.blocked_until - monotonic()
+                    if blocked_sec > 0:
+                        await sleep(blocked_sec)
+                        continue
+                    self.__refill()
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    await sleep((1 - self._tokens) / self.rate)
+        finally:
+            self.waiting -= 1
+
+    def block(self, *, seconds: float) -> None:
+        """Приостанавливает выдачу токенов на seconds секунд."""
+        self.blocked_until = max(self.blocked_until, monotonic() + seconds)
+
+    def is_idle(self) -> bool:
+        """Проверяет, что корзина полна, не приостановлена и токен никто не ожидает."""
+        self.__refill()
+        return self.waiting == 0 and self._tokens >= self.capacity and self.blocked_until <= monotonic()
+
+    def __refill(self) -> None:
+        """Пополняет корзину за прошедшее время."""
+        now: float = monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+
+class RateLimitMiddleware(BaseRequestMiddleware):
+    """
+    Промежуточный слой ограничения частоты исходящих запросов к Telegram Bot API.
+
+    Каждый запрос в чат проходит через общую корзину токенов бота, а запрос
+    в групповой чат - дополнительно через корзину этой группы. При ответе
+    Telegram "Too Many Requests" на retry_after секунд приостанавливается
+    корзина группы (для групповых чатов) или общая корзина, после чего
+    запрос повторяется: остальные запросы в ту же корзину тоже ждут.
+    """
+
+    def __init__(
+        self,
+        *,
+        global_per_sec: float,
+        group_per_min: float,
+        group_burst: int,
+        retry_attempts: int,
+    ):
+        self.global_bucket: TokenBucket = TokenBucket(capacity=global_per_sec, rate=global_per_sec)
+        self.group_burst: int = group_burst
+        self.group_rate: float = group_per_min / 60
+        self.retry_after_count: int = 0
+        self.retry_attempts: int = retry_attempts
+        self._group_buckets: dict[str, TokenBucket] = {}
+
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType[TelegramType],
+        bot: Bot,
+        method: TelegramMethod[TelegramType],
+    ) -> Response[TelegramType]:
+        chat_id: int | str | None = getattr(method, 'chat_id', None)
+        if chat_id is None:
+            return await make_request(bot, method)
+
+        group_bucket: TokenBucket | None = self.__get_group_bucket(chat_id=str(chat_id))
+        attempt: int = 0
+        while True:
+            if group_bucket is not None:
+                await group_bucket.acquire()
+            await self.global_bucket.acquire()
+            try:
+                return await make_request(bot, method)
+            except TelegramRetryAfter as err:
+                if attempt >= self.retry_attempts:
+                    raise
+                attempt += 1
+                self.retry_after_count += 1
+                (group_bucket or self.global_bucket).block(seconds=err.retry_after)
+
+    def get_metrics(self) -> dict[str, int]:
+        """
+        Возвращает метрики очередей исходящих запросов.
+        """
+        return {
+            'global_queue': self.global_bucket.waiting,
+            'group_queue': sum(b.waiting for b in self._group_buckets.values()),
+            'group_buckets': len(self._group_buckets),
+            'retry_after_count': self.retry_after_count,
+        }
+
+    def __get_group_bucket(self, chat_id: str) -> TokenBucket | None:
+        """
+        Возвращает корзину группового чата (None для личных чатов).
+        """
+        if not chat_id.startswith('-'):
+            return None
+
+        bucket: TokenBucket | None = self._group_buckets.get(chat_id)
+        if bucket is None:
+            if len(self._group_buckets) >= GROUP_BUCKETS_PRUNE_SIZE:
+                self._group_buckets = {k: b for k, b in self._group_buckets.items() if not b.is_idle()}
+            bucket = TokenBucket(capacity=self.group_burst, rate=self.group_rate)
+            self._group_buckets[chat_id] = bucket
+        return bucket
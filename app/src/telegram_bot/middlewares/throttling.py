@@ -0,0 +1,108 @@
+"""
+Модуль промежуточного слоя ограничения частоты обновлений от пользователей.
+"""
+
+from collections import deque
+from time import monotonic
+from typing import (
+    Awaitable,
+    Callable,
+)
+
+from aiogram import BaseMiddleware
+from aiogram.types import (
+    TelegramObject,
+    User,
+)
+
+from app.src.config.config import settings
+from app.src.utils.auth import (
+    UserRoles,
+    get_user_role,
+)
+
+# INFO. Количество окон пользователей, после которого удаляются неиспользуемые.
+USER_WINDOWS_PRUNE_SIZE: int = 10_000
+
+
+class ThrottlingMiddleware(BaseMiddleware):
+    """
+    Промежуточный слой ограничения частоты обновлений от пользователей.
+
+    Для каждого пользователя хранится время его обновлений за последние
+    window_sec секунд (скользящее окно). Если в окне уже user_limit обновлений
+    (admin_limit - для администраторов и разработчиков), то обновление
+    отбрасывается до фильтров и обработчиков и не занимает соединение
+    с базой данных. Окна хранятся в памяти процесса.
+    """
+
+    def __init__(
+        self,
+        *,
+        window_sec: float,
+        user_limit: int,
+        admin_limit: int,
+    ):
+        self.admin_limit: int = admin_limit
+        self.dropped_count: int = 0
+        self.user_limit: int = user_limit
+        self.window_sec: float = window_sec
+        self._windows: dict[int, deque[float]] = {}
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, dict[str, any]], Awaitable[any]],
+        event: TelegramObject,
+        data: dict[str, any],
+    ) -> any:
+        user: User | None = data.get('event_from_user')
+        if user is None or self.__is_allowed(user_id=user.id):
+            return await handler(event, data)
+        self.dropped_count += 1
+
+    def get_metrics(self) -> dict[str, int]:
+        """
+        Возвращает метрики ограничения частоты обновлений.
+        """
+        return {
+            'users': len(self._windows),
+            'dropped_count': self.dropped_count,
+        }
+
+    def __is_allowed(self, user_id: int) -> bool:
+        """
+        Учитывает обновление в окне пользователя.
+        Возвращает False, если лимит обновлений в окне исчерпан.
+        """
+        now: float = monotonic()
+        window: deque[float] | None = self._windows.get(user_id)
+        if window is None:
+            if len(self._windows) >= USER_WINDOWS_PRUNE_SIZE:
+                self.__prune(now=now)
+            window = deque()
+            self._windows[user_id] = window
+
+        while window and window[0] <= now - self.window_sec:
+            window.popleft()
+
+        limit: int = self.user_limit if get_user_role(user_id_telegram=user_id) == UserRoles.USER else self.admin_limit
+        if len(window) >= limit:
+            return False
+        window.append(now)
+        return True
+
+    def __prune(self, now: float) -> None:
+        """Удаляет окна пользователей без обновлений за последние window_sec секунд."""
+        self._windows = {
+            user_id: window
+            for user_id, window
+            in self._windows.items()
+            if window and window[-1] > now - self.window_sec
+        }
+
+
+throttling_middleware: ThrottlingMiddleware = ThrottlingMiddleware(
+    window_sec=settings.THROTTLE_WINDOW_SEC,
+    user_limit=settings.THROTTLE_USER_LIMIT,
+    admin_limit=settings.THROTTLE_ADMIN_LIMIT,
+)
@@ -0,0 +1,36 @@
+"""
+Модуль приема обновлений Telegram через long polling.
+"""
+
+from aiogram.types import Update
+
+from app.src.telegram_bot.bot import bot
+from app.src.telegram_bot.dispatcher import dp
+from app.src.telegram_bot.lifecycle import (
+    listen_updates,
+    run_until_stop_signal,
+)
+from app.src.telegram_bot.processor import update_processor
+
+
+async def run_polling() -> None:
+    """
+    Получает обновления от Telegram и передает их в update_processor
+    до сигнала SIGINT или SIGTERM.
+
+    В отличие от dp.start_polling, количество одновременно обрабатываемых
+    и ожидающих обработки обновлений ограничено (см. UpdateProcessor).
+    """
+    await dp.emit_startup(bot=bot, dispatcher=dp)
+    try:
+        await run_until_stop_signal(__submit_updates())
+    finally:
+        await dp.emit_shutdown(bot=bot, dispatcher=dp)
+        await bot.session.close()
+
+
+async def __submit_updates() -> None:
+    """Передает полученные обновления в update_processor."""
+    update: Update
+    async for update in listen_updates():
+        await update_processor.submit(update=update)
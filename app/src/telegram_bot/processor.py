@@ -0,0 +1,197 @@
+"""
+Модуль конкурентной обработки обновлений Telegram.
+"""
+
+import logging
+from asyncio import (
+    Condition,
+    Semaphore,
+    Task,
+    create_task,
+    gather,
+    wait,
+)
+from collections import deque
+from time import monotonic
+from typing import (
+    Coroutine,
+    Literal,
+)
+
+from aiogram import (
+    Bot,
+    Dispatcher,
+)
+from aiogram.dispatcher.middlewares.user_context import (
+    EventContext,
+    UserContextMiddleware,
+)
+from aiogram.types import Update
+
+from app.src.config.config import settings
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class UpdateProcessor:
+    """
+    Класс обработки обновлений с ограничением конкурентности.
+
+    Обновления одного чата (или пользователя, если чата нет) ставятся
+    в отдельную очередь и обрабатываются строго по порядку, обновления
+    разных чатов - конкурентно, но не более max_in_flight одновременно.
+
+    Количество принятых и еще не обработанных обновлений ограничено
+    queue_size, а в очереди одного чата - chat_queue_size. При превышении
+    ограничений поведение определяет overflow_policy:
+        - defer: submit() дожидается освобождения места в очереди
+        - shed: обновление отбрасывается
+    """
+
+    def __init__(
+        self,
+        *,
+        max_in_flight: int,
+        queue_size: int,
+        chat_queue_size: int,
+        overflow_policy: Literal['defer', 'shed'],
+    ):
+        self.chat_queue_size: int = chat_queue_size
+        self.max_in_flight: int = max_in_flight
+        self.overflow_policy: Literal['defer', 'shed'] = overflow_policy
+        self.queue_size: int = queue_size
+        self._bot: Bot | None = None
+        self._chats: dict[int, deque[Update]] = {}
+        self._deferred_count: int = 0
+        self._dispatcher: Dispatcher | None = None
+        self._in_flight: int = 0
+        self._is_accepting: bool = False
+        self._pending: int = 0
+        self._released: Condition = Condition()
+        self._semaphore: Semaphore = Semaphore(max_in_flight)
+        self._shed_count: int = 0
+        self._tasks: set[Task] = set()
+
+    def start(self, *, dispatcher: Dispatcher, bot: Bot) -> None:
+        """Начинает прием обновлений для обработки в dispatcher."""
+        self._dispatcher = dispatcher
+        self._bot = bot
+        self._is_accepting = True
+
+    async def submit(self, *, update: Update) -> bool:
+        """
+        Ставит обновление в очередь на обработку.
+
+        Возвращает False, если обновление отброшено:
+        прием остановлен или очередь заполнена при overflow_policy=shed.
+        """
+        key: int | None = self.__get_chat_key(update=update)
+        if not self.__has_space(key=key):
+            if self.overflow_policy == 'shed':
+                self._shed_count += 1
+                logger.warning('Очередь обновлений заполнена, обновление %s отброшено', update.update_id)
+                return False
+            self._deferred_count += 1
+            async with self._released:
+                await self._released.wait_for(lambda: self.__has_space(key=key))
+
+        if not self._is_accepting:
+            return False
+
+        self._pending += 1
+        if key is None:
+            self.__create_task(self.__process(update=update))
+        elif key in self._chats:
+            self._chats[key].append(update)
+        else:
+            self._chats[key] = deque((update,))
+            self.__create_task(self.__run_chat(key=key))
+        return True
+
+    async def drain(self, *, timeout_sec: float) -> None:
+        """
+        Прекращает прием обновлений и дожидается обработки принятых
+        (не дольше timeout_sec секунд). Не завершившиеся за это время
+        задачи обработки отменяются.
+        """
+        self._is_accepting = False
+        async with self._released:
+            self._released.notify_all()
+        deadline: float = monotonic() + timeout_sec
+        while self._tasks and deadline > monotonic():
+            await wait(self._tasks, timeout=deadline - monotonic())
+        if not self._tasks:
+            return
+
+        logger.warning('Не обработано обновлений: %s', self._pending)
+        tasks: tuple[Task, ...] = tuple(self._tasks)
+        for task in tasks:
+            task.cancel()
+        await gather(*tasks, return_exceptions=True)
+
+    def get_metrics(self) -> dict[str, int]:
+        """Возвращает текущее состояние очередей обработки обновлений."""
+        return {
+            'in_flight': self._in_flight,
+            'pending': self._pending,
+            'chats': len(self._chats),
+            'deferred_count': self._deferred_count,
+            'shed_count': self._shed_count,
+        }
+
+    def __create_task(self, coro: Coroutine) -> None:
+        """Создает задачу и хранит ссылку на нее до завершения."""
+        task: Task = create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    @staticmethod
+    def __get_chat_key(update: Update) -> int | None:
+        """Возвращает ключ очереди обновления: ID чата или пользователя."""
+        context: EventContext = UserContextMiddleware.resolve_event_context(event=update)
+        if context.chat is not None:
+            return context.chat.id
+        if context.user is not None:
+            return context.user.id
+        return None
+
+    def __has_space(self, key: int | None) -> bool:
+        """Проверяет, есть ли место для обновления в очередях."""
+        if not self._is_accepting:
+            return True
+        if self._pending >= self.queue_size:
+            return False
+        return key not in self._chats or len(self._chats[key]) < self.chat_queue_size
+
+    async def __process(self, update: Update) -> None:
+        """Обрабатывает обновление, когда освобождается место среди обрабатываемых."""
+        try:
+            async with self._semaphore:
+                self._in_flight += 1
+                try:
+                    await self._dispatcher.feed_update(bot=self._bot, update=update)
+                except Exception:
+                    logger.exception('Ошибка обработки обновления %s', update.update_id)
+                finally:
+                    self._in_flight -= 1
+        finally:
+            # INFO. Обновление учитывается и при отмене задачи в ожидании семафора.
+            self._pending -= 1
+
+        async with self._released:
+            self._released.notify_all()
+
+    async def __run_chat(self, key: int) -> None:
+        """Последовательно обрабатывает очередь обновлений чата."""
+        queue: deque[Update] = self._chats[key]
+        while queue:
+            await self.__process(update=queue.popleft())
+        del self._chats[key]
+
+
+update_processor: UpdateProcessor = UpdateProcessor(
+    max_in_flight=settings.UPDATE_MAX_IN_FLIGHT,
+    queue_size=settings.UPDATE_QUEUE_SIZE,
+    chat_queue_size=settings.UPDATE_CHAT_QUEUE_SIZE,
+    overflow_policy=settings.UPDATE_OVERFLOW_POLICY,
+)
@@ -1,4 +1,3 @@
-from asyncio import sleep as async_sleep
 
 from aiogram import (
     Router,
@@ -14,12 +13,13 @@ from aiogram.types import (
     ReplyKeyboardRemove,
 )
 from aiogram.utils.text_decorations import markdown_decoration
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.src.crud.course import course_crud
-from app.src.database.database import async_session_maker
 from app.src.telegram_bot.routers.start import command_start
 from app.src.utils.auth import IsAdmin
-from app.src.utils.message import delete_messages_list
+from app.src.utils.course import course_catalog
+from app.src.utils.message import message_cleanup_queue
 from app.src.utils.reply_keyboard import (
     RoutersCommands,
     KEYBOARD_CANCEL,
@@ -210,6 +210,7 @@ async def course_add_ask_keyboard_coordinates(
 async def course_add_complete(
     message: Message,
     state: FSMContext,
+    session: AsyncSession,
 ) -> None:
     """
     Устанавливает координаты курса.
@@ -233,35 +234,41 @@ async def course_add_complete(
     state_data: dict[str, any] = await state.get_data()
 
     try:
-        async with async_session_maker() as session:
-            await course_crud.create(
-                obj_data={
-                    'title': state_data['title'],
-                    'description': state_data['description'],
-                    'picture_file_id': state_data['picture_file_id'],
-                    'tariffs': state_data['tariffs'],
-                    'keyboard_coordinates': state_data['keyboard_coordinates'],
-                    'user_id_telegram': message.from_user.id,
-                },
-                session=session,
-            )
+        await course_crud.create(
+            obj_data={
+                'title': state_data['title'],
+                'description': state_data['description'],
+                'picture_file_id': state_data['picture_file_id'],
+                'tariffs': state_data['tariffs'],
+                'keyboard_coordinates': state_data['keyboard_coordinates'],
+                'user_id_telegram': message.from_user.id,
+            },
+            session=session,
+        )
+        course_catalog.invalidate()
         text='Курс успешно создан!'
     except Exception as err:
+        await session.rollback()
         text: str = f'Произошла ошибка при добавлении курса!'
     await message.answer(
         text=text,
         reply_markup=ReplyKeyboardRemove(),
     )
-    await async_sleep(1)
-    await __cancel(message=message, state=state)
+    await __cancel(message=message, state=state, delete_delay_sec=1)
 
 
-async def __cancel(message: Message, state: FSMContext) -> None:
+async def __cancel(
+    message: Message,
+    state: FSMContext,
+    delete_delay_sec: float = 0,
+) -> None:
     """Обрабатывает команду отмены формы создания и возврат в главное меню."""
     state_data: dict[str, any] = await state.get_data()
-    await delete_messages_list(
+    await state.clear()
+    main_menu: Message = await command_start(message=message, from_command_start=False)
+    # INFO. Удаляются сообщения формы, отправленные до нового сообщения "Главная".
+    message_cleanup_queue.put(
         chat_id=message.chat.id,
-        messages_ids=list(range(state_data['_init_message_id'], message.message_id + 2)),
+        messages_ids=list(range(state_data['_init_message_id'], main_menu.message_id)),
+        delay_sec=delete_delay_sec,
     )
-    await state.clear()
-    await command_start(message=message, from_command_start=False)
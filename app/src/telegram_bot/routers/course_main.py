@@ -1,5 +1,3 @@
-from typing import TYPE_CHECKING
-
 from aiogram import Router
 from aiogram.filters import BaseFilter
 from aiogram.fsm.context import FSMContext
@@ -7,13 +5,11 @@ from aiogram.fsm.state import (
     StatesGroup,
     State,
 )
-from app.src.crud.course import course_crud
-from app.src.database.database import async_session_maker
 from app.src.telegram_bot.routers.start import command_start
 from aiogram.types import Message
 
-from app.src.utils.course import get_all_courses_titles
-from app.src.utils.message import delete_messages_list
+from app.src.utils.course import course_catalog
+from app.src.utils.message import message_cleanup_queue
 from app.src.utils.reply_keyboard import (
     RoutersCommands,
     KEYBOARD_COURSE,
@@ -21,15 +17,15 @@ from app.src.utils.reply_keyboard import (
     KEYBOARD_HOME,
 )
 
-if TYPE_CHECKING:
-    from app.src.models.course import Course
-
 router: Router = Router()
 
 class DynamicCourseTitleFilter(BaseFilter):
+    """
+    Фильтр сообщений с названием существующего курса.
+    """
+
     async def __call__(self, message: Message) -> bool:
-        course_titles = await get_all_courses_titles()
-        return message.text in course_titles
+        return await course_catalog.has_title(title=message.text)
 
 
 class CourseMainForm(StatesGroup):
@@ -51,16 +47,17 @@ async def course_description(
     Показывает описание курса.
     Запрашивает дальнейшие действия.
     """
-    async with async_session_maker() as session:
-        course: Course = await course_crud.retrieve_by_title(obj_title=message.text, session=session)
+    course: dict[str, any] | None = await course_catalog.get_course_by_title(title=message.text)
+    if course is None:
+        return
 
     await state.update_data(_init_message_id=message.message_id)
-    await state.update_data(_course_id=course.id)
+    await state.update_data(_course_id=course['id'])
     await state.set_state(state=CourseMainForm.selected)
 
     await message.answer_photo(
-        photo=course.picture_file_id,
-        caption=course.description,
+        photo=course['picture_file_id'],
+        caption=course['caption'],
         reply_markup=KEYBOARD_COURSE,
         parse_mode='MarkdownV2',
     )
@@ -84,11 +81,12 @@ async def _show_tariffs(message: Message, state: FSMContext) -> None:
     Показывает тарифы курса.
     """
     state_data: dict[str, any] = await state.get_data()
-    async with async_session_maker() as session:
-        course: Course = await course_crud.retrieve_by_id(obj_id=state_data['_course_id'], session=session)
+    course: dict[str, any] | None = await course_catalog.get_course_by_id(course_id=state_data['_course_id'])
+    if course is None:
+        return await __cancel(message=message, state=state)
 
     await message.answer(
-        text=course.tariffs,
+        text=course['tariffs'],
         reply_markup=KEYBOARD_COURSE_TARIFF,
         parse_mode='MarkdownV2',
     )
@@ -112,14 +110,20 @@ async def _buy(message: Message, state: FSMContext) -> None:
     )
 
 
-async def __cancel(message: Message, state: FSMContext) -> None:
+async def __cancel(
+    message: Message,
+    state: FSMContext,
+    delete_delay_sec: float = 0,
+) -> None:
     """
     Обрабатывает команду отмены формы создания и возврат в главное меню.
     """
     state_data: dict[str, any] = await state.get_data()
-    await delete_messages_list(
+    await state.clear()
+    main_menu: Message = await command_start(message=message, from_command_start=False)
+    # INFO. Удаляются сообщения формы, отправленные до нового сообщения "Главная".
+    message_cleanup_queue.put(
         chat_id=message.chat.id,
-        messages_ids=list(range(state_data['_init_message_id'], message.message_id + 2)),
+        messages_ids=list(range(state_data['_init_message_id'], main_menu.message_id)),
+        delay_sec=delete_delay_sec,
     )
-    await state.clear()
-    await command_start(message=message, from_command_start=False)
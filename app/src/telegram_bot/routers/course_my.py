@@ -1,4 +1,3 @@
-from asyncio import sleep as async_sleep
 from typing import TYPE_CHECKING
 
 from aiogram import (
@@ -15,13 +14,16 @@ from aiogram.types import (
     ReplyKeyboardRemove,
 )
 from aiogram.utils.text_decorations import markdown_decoration
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.src.crud.course import course_crud
-from app.src.database.database import async_session_maker
 from app.src.telegram_bot.routers.start import command_start
 from app.src.utils.auth import IsAdmin
-from app.src.utils.message import delete_messages_list
-from app.src.utils.course import get_all_courses_titles
+from app.src.utils.message import message_cleanup_queue
+from app.src.utils.course import (
+    course_catalog,
+    get_all_courses_titles,
+)
 from app.src.utils.reply_keyboard import (
     RoutersCommands,
     make_row_keyboard,
@@ -76,8 +78,7 @@ async def my_course_ask_title(
     courses_all_titles: list[str | None] = await get_all_courses_titles()
     if not courses_all_titles:
         await message.answer(text='Нет активных курсов.')
-        await async_sleep(1)
-        return await __cancel(message=message, state=state)
+        return await __cancel(message=message, state=state, delete_delay_sec=1)
 
     rows = []
     MAX_ITEMS: int = 2
@@ -105,8 +106,7 @@ async def my_course_ask_action(
     if message.text == RoutersCommands.HOME:
         return await __cancel(message=message, state=state)
 
-    async with async_session_maker() as session:
-        course: Course | None = await course_crud.retrieve_by_title(obj_title=message.text, session=session)
+    course: dict[str, any] | None = await course_catalog.get_course_by_title(title=message.text)
     if not course:
         courses_all_titles: list[str | None] = await get_all_courses_titles()
         await message.answer(
@@ -116,30 +116,18 @@ async def my_course_ask_action(
         return
 
     await state.update_data(title=message.text)
-    await state.update_data(_course_id=course.id)
+    await state.update_data(_course_id=course['id'])
     await state.set_state(state=MyCoursesStatesGroup.action)
 
-    course_data: dict[str, any] = course.to_dict_repr()
     await message.answer_photo(
-        photo=course_data['picture_file_id'],
-        reply_markup=ReplyKeyboardRemove(),
-    )
-    await message.answer(
-        text=course_data['description'],
+        photo=course['picture_file_id'],
+        caption=course['caption'],
         reply_markup=ReplyKeyboardRemove(),
         parse_mode='MarkdownV2',
     )
     await message.answer(
-        text=course_data['tariffs'],
-        reply_markup=ReplyKeyboardRemove(),
+        text=f'{course["admin_preview_text"]}\n\nЧто нужно сделать?',
         parse_mode='MarkdownV2',
-    )
-    await message.answer(
-        text=f'координаты на клавиатуре: {course_data["keyboard_coordinates"]}',
-        reply_markup=ReplyKeyboardRemove(),
-    )
-    await message.answer(
-        text='Что нужно сделать?',
         reply_markup=make_row_keyboard(
             # TODO. Вынести в константы.
             rows=(
@@ -184,6 +172,7 @@ async def validate_action(
 async def my_course_change_title(
     message: Message,
     state: FSMContext,
+    session: AsyncSession,
 ) -> None:
     """
     Изменяет название курса.
@@ -200,25 +189,25 @@ async def my_course_change_title(
         )
         return
 
-    async with async_session_maker() as session:
-        await course_crud.update_by_id(
-            obj_id=(await state.get_data())['_course_id'],
-            obj_data={'title': title},
-            session=session,
-        )
+    await course_crud.update_by_id(
+        obj_id=(await state.get_data())['_course_id'],
+        obj_data={'title': title},
+        session=session,
+    )
+    course_catalog.invalidate()
 
     await message.answer(
         text='Название курса изменено.',
         reply_markup=ReplyKeyboardRemove(),
     )
-    await async_sleep(1)
-    await __cancel(message=message, state=state)
+    await __cancel(message=message, state=state, delete_delay_sec=1)
 
 
 @router.message(MyCoursesStatesGroup.change_description)
 async def my_course_change_description(
     message: Message,
     state: FSMContext,
+    session: AsyncSession,
 ) -> None:
     """
     Изменяет описание курса.
@@ -237,25 +226,25 @@ async def my_course_change_description(
         )
         return
 
-    async with async_session_maker() as session:
-        await course_crud.update_by_id(
-            obj_id=(await state.get_data())['_course_id'],
-            obj_data={'description': markdown_decoration.unparse(text=message.text, entities=message.entities)},
-            session=session,
-        )
+    await course_crud.update_by_id(
+        obj_id=(await state.get_data())['_course_id'],
+        obj_data={'description': markdown_decoration.unparse(text=message.text, entities=message.entities)},
+        session=session,
+    )
+    course_catalog.invalidate()
 
     await message.answer(
         text='Описание курса изменено.',
         reply_markup=ReplyKeyboardRemove(),
     )
-    await async_sleep(1)
-    await __cancel(message=message, state=state)
+    await __cancel(message=message, state=state, delete_delay_sec=1)
 
 
 @router.message(MyCoursesStatesGroup.change_tariffs)
 async def my_course_change_tariffs(
     message: Message,
     state: FSMContext,
+    session: AsyncSession,
 ) -> None:
     """
     Изменяет описание тарифов курса.
@@ -272,25 +261,25 @@ async def my_course_change_tariffs(
         )
         return
 
-    async with async_session_maker() as session:
-        await course_crud.update_by_id(
-            obj_id=(await state.get_data())['_course_id'],
-            obj_data={'tariffs': markdown_decoration.unparse(text=message.text, entities=message.entities)},
-            session=session,
-        )
+    await course_crud.update_by_id(
+        obj_id=(await state.get_data())['_course_id'],
+        obj_data={'tariffs': markdown_decoration.unparse(text=message.text, entities=message.entities)},
+        session=session,
+    )
+    course_catalog.invalidate()
 
     await message.answer(
         text='Описание тарифов курса изменено.',
         reply_markup=ReplyKeyboardRemove(),
     )
-    await async_sleep(1)
-    await __cancel(message=message, state=state)
+    await __cancel(message=message, state=state, delete_delay_sec=1)
 
 
 @router.message(MyCoursesStatesGroup.change_photo)
 async def my_course_change_photo(
     message: Message,
     state: FSMContext,
+    session: AsyncSession,
 ) -> None:
     """
     Изменяет описание тарифов курса.
@@ -309,25 +298,25 @@ async def my_course_change_photo(
         )
         return
 
-    async with async_session_maker() as session:
-        await course_crud.update_by_id(
-            obj_id=(await state.get_data())['_course_id'],
-            obj_data={'picture_file_id': picture_file_id},
-            session=session,
-        )
+    await course_crud.update_by_id(
+        obj_id=(await state.get_data())['_course_id'],
+        obj_data={'picture_file_id': picture_file_id},
+        session=session,
+    )
+    course_catalog.invalidate()
 
     await message.answer(
         text='Картинка курса изменена.',
         reply_markup=ReplyKeyboardRemove(),
     )
-    await async_sleep(1)
-    await __cancel(message=message, state=state)
+    await __cancel(message=message, state=state, delete_delay_sec=1)
 
 
 @router.message(MyCoursesStatesGroup.change_keyboard_coordinates)
 async def my_course_change_keyboard_coordinates(
     message: Message,
     state: FSMContext,
+    session: AsyncSession,
 ) -> None:
     """
     Изменяет описание тарифов курса.
@@ -344,25 +333,25 @@ async def my_course_change_keyboard_coordinates(
         )
         return
 
-    async with async_session_maker() as session:
-        await course_crud.update_by_id(
-            obj_id=(await state.get_data())['_course_id'],
-            obj_data={'keyboard_coordinates': keyboard_coordinates},
-            session=session,
-        )
+    await course_crud.update_by_id(
+        obj_id=(await state.get_data())['_course_id'],
+        obj_data={'keyboard_coordinates': keyboard_coordinates},
+        session=session,
+    )
+    course_catalog.invalidate()
 
     await message.answer(
         text='Координаты курса на клавиатуре изменены.',
         reply_markup=ReplyKeyboardRemove(),
     )
-    await async_sleep(1)
-    await __cancel(message=message, state=state)
+    await __cancel(message=message, state=state, delete_delay_sec=1)
 
 
 @router.message(MyCoursesStatesGroup.delete)
 async def my_course_delete(
     message: Message,
     state: FSMContext,
+    session: AsyncSession,
 ) -> None:
     """
     Удаляет курс.
@@ -377,22 +366,21 @@ async def my_course_delete(
         return
 
     state_data: dict[str, any] = await state.get_data()
-    async with async_session_maker() as session:
-        course: Course = await course_crud.retrieve_by_title(
-            obj_title=state_data['title'],
-            session=session,
-        )
-        await course_crud.delete_by_id(
-            obj_id=course.id,
-            session=session,
-        )
+    course: Course = await course_crud.retrieve_by_title(
+        obj_title=state_data['title'],
+        session=session,
+    )
+    await course_crud.delete_by_id(
+        obj_id=course.id,
+        session=session,
+    )
+    course_catalog.invalidate()
 
     await message.answer(
         text='Курс удален',
         reply_markup=ReplyKeyboardRemove(),
     )
-    await async_sleep(1)
-    await __cancel(message=message, state=state)
+    await __cancel(message=message, state=state, delete_delay_sec=1)
 
 
 # TODO. Это не приватные методы, надо переименовать.
@@ -496,12 +484,18 @@ async def _validate_action_delete(
     )
 
 
-async def __cancel(message: Message, state: FSMContext) -> None:
+async def __cancel(
+    message: Message,
+    state: FSMContext,
+    delete_delay_sec: float = 0,
+) -> None:
     """Обрабатывает команду отмены просмотра опросов."""
     state_data: dict[str, any] = await state.get_data()
-    await delete_messages_list(
+    await state.clear()
+    main_menu: Message = await command_start(message=message, from_command_start=False)
+    # INFO. Удаляются сообщения формы, отправленные до нового сообщения "Главная".
+    message_cleanup_queue.put(
         chat_id=message.chat.id,
-        messages_ids=list(range(state_data['_init_message_id'], message.message_id + 2)),
+        messages_ids=list(range(state_data['_init_message_id'], main_menu.message_id)),
+        delay_sec=delete_delay_sec,
     )
-    await state.clear()
-    await command_start(message=message, from_command_start=False)
@@ -1,9 +1,8 @@
 from aiogram import Router
 from aiogram.types import Message
 
-from app.src.utils.message import delete_messages_list
 from app.src.telegram_bot.routers.start import command_start
-from app.src.utils.message import delete_messages_list
+from app.src.utils.message import message_cleanup_queue
 from app.src.utils.reply_keyboard import RoutersCommands
 
 router: Router = Router()
@@ -18,10 +17,10 @@ async def fallback(message: Message):
         return
 
     if message.text in (RoutersCommands.CANCEL, RoutersCommands.HOME):
-        await delete_messages_list(chat_id=message.chat.id, messages_ids=list(range(message.message_id-10, message.message_id + 1)))
+        message_cleanup_queue.put(chat_id=message.chat.id, messages_ids=list(range(message.message_id-10, message.message_id + 1)))
         return await command_start(message=message, from_command_start=False)
 
-    await delete_messages_list(
+    message_cleanup_queue.put(
         chat_id=message.chat.id,
         messages_ids=[message.message_id],
     )
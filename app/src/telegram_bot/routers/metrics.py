@@ -0,0 +1,58 @@
+from aiogram import (
+    Router,
+    F,
+)
+from aiogram.types import Message
+
+from app.src.database.database import async_engine
+from app.src.telegram_bot.bot import rate_limit_middleware
+from app.src.telegram_bot.middlewares.dedup import dedup_middleware
+from app.src.telegram_bot.middlewares.throttling import throttling_middleware
+from app.src.telegram_bot.processor import update_processor
+from app.src.utils.auth import IsDeveloper
+from app.src.utils.message import message_cleanup_queue
+from app.src.utils.reply_keyboard import RoutersCommands
+
+router: Router = Router()
+
+
+@router.message(
+    IsDeveloper(),
+    F.text == RoutersCommands.METRICS,
+)
+async def command_metrics(message: Message) -> None:
+    """
+    Обрабатывает команду "Метрики".
+    """
+    rate_limit: dict[str, int] = rate_limit_middleware.get_metrics()
+    db_pool: dict[str, int | float] = async_engine.pool.get_metrics()
+    updates: dict[str, int] = update_processor.get_metrics()
+    throttling: dict[str, int] = throttling_middleware.get_metrics()
+    dedup: dict[str, int] = dedup_middleware.get_metrics()
+    await message.answer(
+        text=(
+            'Обработка обновлений:\n'
+            f'    - принято: {updates["pending"]}, обрабатывается: {updates["in_flight"]}\n'
+            f'    - чатов в очереди: {updates["chats"]}\n'
+            f'    - отложено: {updates["deferred_count"]}, отброшено: {updates["shed_count"]}\n'
+            f'    - отброшено из-за флуда: {throttling["dropped_count"]} (пользователей в окне: {throttling["users"]})\n'
+            f'    - отброшено повторных: {dedup["dropped_count"]} (ID в памяти: {dedup["seen"]})\n'
+            '\n'
+            'Исходящие запросы к Telegram:\n'
+            f'    - в общей очереди: {rate_limit["global_queue"]}\n'
+            f'    - в очередях групп: {rate_limit["group_queue"]}\n'
+            f'    - групп с лимитом: {rate_limit["group_buckets"]}\n'
+            f'    - повторов после "Too Many Requests": {rate_limit["retry_after_count"]}\n'
+            '\n'
+            'Пул соединений PostgreSQL:\n'
+            f'    - размер: {db_pool["size"]}, overflow: {db_pool["overflow"]}\n'
+            f'    - занято: {db_pool["checked_out"]}, свободно: {db_pool["checked_in"]}\n'
+            f'    - получений соединения: {db_pool["checkouts_count"]}, таймаутов: {db_pool["timeouts_count"]}\n'
+            f'    - время получения (мс): среднее {db_pool["wait_ms_avg"]}, максимальное {db_pool["wait_ms_max"]}'
+        ),
+    )
+    message_cleanup_queue.put(
+        chat_id=message.chat.id,
+        messages_ids=list(range(message.message_id, message.message_id + 2)),
+        delay_sec=10,
+    )
@@ -1,4 +1,3 @@
-from asyncio import sleep as asyncio_sleep
 from datetime import time
 from typing import TYPE_CHECKING
 
@@ -15,15 +14,13 @@ from aiogram.types import (
     Message,
     ReplyKeyboardRemove,
 )
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.src.crud.poll import poll_crud
-from app.src.database.database import (
-    RedisKeys,
-    async_session_maker,
-)
+from app.src.database.database import RedisKeys
 from app.src.telegram_bot.routers.start import command_start
 from app.src.utils.auth import IsAdmin
-from app.src.utils.message import delete_messages_list
+from app.src.utils.message import message_cleanup_queue
 from app.src.utils.chat import (
     get_chat_id_by_title,
     get_chat_all_titles,
@@ -86,8 +83,7 @@ async def add_poll_ask_title(
 
     if not await get_chat_all_titles():
         await message.answer(text='Бот не добавлен ни в один Telegram-чат.')
-        await asyncio_sleep(2)
-        await __cancel(message=message, state=state)
+        await __cancel(message=message, state=state, delete_delay_sec=2)
     else:
         await message.answer(
             text='Как будет называться этот опрос в панели управления? Например, "Хип-Хоп (ср/сб)"',
@@ -326,6 +322,7 @@ async def add_poll_ask_is_allows_multiple_answers(
 async def add_poll_ask_finish(
     message: Message,
     state: FSMContext,
+    session: AsyncSession,
 ) -> None:
     """
     Устанавливает возможность множественного выбора.
@@ -361,31 +358,39 @@ async def add_poll_ask_finish(
     }
 
     try:
-        async with async_session_maker() as session:
-            poll: Poll = await poll_crud.create(
-                obj_data=obj_data,
-                session=session,
-            )
-            obj_data['id'] = poll.id
+        poll: Poll = await poll_crud.create(
+            obj_data=obj_data,
+            session=session,
+        )
+        obj_data['id'] = poll.id
 
         schedule_poll_sending(poll=poll)
 
         text: str = f'Опрос добавлен в рассылку!'
-        redis_delete(key=RedisKeys.POLL_ALL)
+        await redis_delete(key=RedisKeys.POLL_ALL)
     except Exception as err:
-        text: str = f'Произошла ошибка при добавлении опроса!'
+        await session.rollback()
+        if isinstance(err, ValueError) and err.args[0] == poll_crud.unique_columns_err:
+            text: str = err.args[0]
+        else:
+            text: str = f'Произошла ошибка при добавлении опроса!'
 
     await message.answer(text=text, reply_markup=ReplyKeyboardRemove())
-    await asyncio_sleep(1)
-    await __cancel(message=message, state=state)
+    await __cancel(message=message, state=state, delete_delay_sec=1)
 
 
-async def __cancel(message: Message, state: FSMContext) -> None:
+async def __cancel(
+    message: Message,
+    state: FSMContext,
+    delete_delay_sec: float = 0,
+) -> None:
     """Обрабатывает команду отмены формы создания и возврат в главное меню."""
     state_data: dict[str, any] = await state.get_data()
-    await delete_messages_list(
+    await state.clear()
+    main_menu: Message = await command_start(message=message, from_command_start=False)
+    # INFO. Удаляются сообщения формы, отправленные до нового сообщения "Главная".
+    message_cleanup_queue.put(
         chat_id=message.chat.id,
-        messages_ids=list(range(state_data['_init_message_id'], message.message_id + 2)),
+        messages_ids=list(range(state_data['_init_message_id'], main_menu.message_id)),
+        delay_sec=delete_delay_sec,
     )
-    await state.clear()
-    await command_start(message=message, from_command_start=False)
@@ -1,4 +1,3 @@
-from asyncio import sleep as async_sleep
 from typing import TYPE_CHECKING
 
 from aiogram import (
@@ -14,16 +13,18 @@ from aiogram.types import (
     Message,
     ReplyKeyboardRemove,
 )
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.src.crud.chat import chat_crud
 from app.src.crud.poll import poll_crud
-from app.src.database.database import async_session_maker
 from app.src.telegram_bot.routers.start import command_start
-from app.src.scheduler.scheduler import scheduler
 from app.src.utils.auth import IsAdmin
-from app.src.utils.message import delete_messages_list
+from app.src.utils.message import message_cleanup_queue
 from app.src.utils.date import parse_dates_from_text
-from app.src.utils.poll import get_all_polls_titles
+from app.src.utils.poll import (
+    get_all_polls_titles,
+    unschedule_poll_sending,
+)
 from app.src.utils.reply_keyboard import (
     RoutersCommands,
     get_keyboard_main_menu,
@@ -66,8 +67,7 @@ async def my_polls_ask_title(
     polls_all_titles: list[str | None] = await get_all_polls_titles()
     if not polls_all_titles:
         await message.answer(text='Нет активных опросов.')
-        await async_sleep(1)
-        await __cancel(message=message, state=state)
+        await __cancel(message=message, state=state, delete_delay_sec=1)
         return
 
     rows = []
@@ -88,6 +88,7 @@ async def my_polls_ask_title(
 async def my_polls_ask_action(
     message: Message,
     state: FSMContext,
+    session: AsyncSession,
 ) -> None:
     """
     Спрашивает действие для опроса.
@@ -96,8 +97,14 @@ async def my_polls_ask_action(
         await __cancel(message=message, state=state)
         return
 
-    async with async_session_maker() as session:
-        poll: Poll | None = await poll_crud.retrieve_by_title(obj_title=message.text, session=session)
+    poll: Poll | None = await poll_crud.retrieve_by_title(obj_title=message.text, session=session)
+    chat_title: str | None = None
+    if poll:
+        chat_title = (await chat_crud.retrieve_by_chat_id(obj_chat_id=poll.chat_id, session=session)).title
+    # INFO. Транзакция чтения завершается до запросов к Telegram Bot API,
+    #       чтобы соединение с базой данных не занималось на время их выполнения.
+    await session.commit()
+
     if not poll:
         polls_all_titles: list[str | None] = await get_all_polls_titles()
         await message.answer(
@@ -119,8 +126,6 @@ async def my_polls_ask_action(
         for data
         in poll_data['dates_skip']
     ]
-    async with async_session_maker() as session:
-        chat_title: str = (await chat_crud.retrieve_by_chat_id(obj_chat_id=poll_data['chat_id'], session=session)).title
     await message.answer(
         text=(
             f'Название: {poll_data["title"]}\n'
@@ -151,6 +156,7 @@ async def my_polls_ask_action(
 async def validate_action(
     message: Message,
     state: FSMContext,
+    session: AsyncSession,
 ) -> None:
     """
     Определяет необходимое действие с опросом.
@@ -164,13 +170,14 @@ async def validate_action(
     elif message.text == 'Приостановить':
         return await _validate_action_pause(message=message, state=state)
     elif message.text == 'Удалить':
-        return await _validate_action_delete(message=message, state=state)
+        return await _validate_action_delete(message=message, state=state, session=session)
 
 
 @router.message(MyPollsStatesGroup.dates_skip)
 async def pause_poll(
     message: Message,
     state: FSMContext,
+    session: AsyncSession,
 ) -> None:
     """
     Добавляет указанные даты в Poll.dates_skip, чтобы опрос не отправлялся.
@@ -189,21 +196,21 @@ async def pause_poll(
         return
 
     try:
-        async with async_session_maker() as session:
-            poll_data: dict[str, any] = await state.get_data()
-            poll: Poll = await poll_crud.retrieve_by_title(
-                obj_title=poll_data['title'],
-                session=session,
-            )
-            dates.extend(poll.dates_skip)
-            dates.sort()
-            await poll_crud.update_by_id(
-                obj_id=poll.id,
-                obj_data={'dates_skip': dates},
-                session=session,
-                perform_check_unique=False,
-            )
+        poll_data: dict[str, any] = await state.get_data()
+        poll: Poll = await poll_crud.retrieve_by_title(
+            obj_title=poll_data['title'],
+            session=session,
+        )
+        dates.extend(poll.dates_skip)
+        dates.sort()
+        await poll_crud.update_by_id(
+            obj_id=poll.id,
+            obj_data={'dates_skip': dates},
+            session=session,
+            perform_check_unique=False,
+        )
     except Exception as err:
+        await session.rollback()
         await message.answer(
             text=(f'Произошла ошибка изменения дат:\t{err}'),
             reply_markup=await get_keyboard_main_menu(user_id_telegram=message.from_user.id),
@@ -213,14 +220,14 @@ async def pause_poll(
         text=('Даты успешно добавлены!'),
         reply_markup=ReplyKeyboardRemove(),
     )
-    await async_sleep(1)
-    await __cancel(message=message, state=state)
+    await __cancel(message=message, state=state, delete_delay_sec=1)
 
 
 @router.message(MyPollsStatesGroup.resume_days)
 async def resume_poll(
     message: Message,
     state: FSMContext,
+    session: AsyncSession,
 ) -> None:
     """
     Убирает указанные даты из Poll.dates_skip, чтобы опрос отправлялся.
@@ -240,24 +247,24 @@ async def resume_poll(
             return
 
     try:
-        async with async_session_maker() as session:
-            poll_data: dict[str, any] = await state.get_data()
-            poll: Poll = await poll_crud.retrieve_by_title(
-                obj_title=poll_data['title'],
-                session=session,
-            )
-            if message.text != 'Очистить':
-                dates: list[str] = [i for i in poll.dates_skip if i not in dates]
-                dates.sort()
-            else:
-                dates: list = []
-            await poll_crud.update_by_id(
-                obj_id=poll.id,
-                obj_data={'dates_skip': dates},
-                session=session,
-                perform_check_unique=False,
-            )
+        poll_data: dict[str, any] = await state.get_data()
+        poll: Poll = await poll_crud.retrieve_by_title(
+            obj_title=poll_data['title'],
+            session=session,
+        )
+        if message.text != 'Очистить':
+            dates: list[str] = [i for i in poll.dates_skip if i not in dates]
+            dates.sort()
+        else:
+            dates: list = []
+        await poll_crud.update_by_id(
+            obj_id=poll.id,
+            obj_data={'dates_skip': dates},
+            session=session,
+            perform_check_unique=False,
+        )
     except Exception as err:
+        await session.rollback()
         await message.answer(
             text=(f'Произошла ошибка изменения дат:\t{err}'),
             reply_markup=await get_keyboard_main_menu(user_id_telegram=message.from_user.id),
@@ -267,37 +274,33 @@ async def resume_poll(
         text=('Даты успешно удалены!'),
         reply_markup=ReplyKeyboardRemove(),
     )
-    await async_sleep(1)
-    await __cancel(message=message, state=state)
+    await __cancel(message=message, state=state, delete_delay_sec=1)
 
 
 async def _validate_action_delete(
     message: Message,
     state: FSMContext,
+    session: AsyncSession,
 ) -> None:
     """
     Удаляет опрос.
     """
     state_data: dict[str, any] = await state.get_data()
-    async with async_session_maker() as session:
-        poll: Poll = await poll_crud.retrieve_by_title(
-            obj_title=state_data['title'],
-            session=session,
-        )
-        await poll_crud.delete_by_id(
-            obj_id=poll.id,
-            session=session,
-        )
-        for job in scheduler.get_jobs():
-            if job.id.startswith(f'Send poll id={poll.id}'):
-                scheduler.remove_job(job_id=job.id)
+    poll: Poll = await poll_crud.retrieve_by_title(
+        obj_title=state_data['title'],
+        session=session,
+    )
+    await poll_crud.delete_by_id(
+        obj_id=poll.id,
+        session=session,
+    )
+    unschedule_poll_sending(poll=poll)
 
     await message.answer(
         text='Опрос удален',
         reply_markup=ReplyKeyboardRemove(),
     )
-    await async_sleep(1)
-    await __cancel(message=message, state=state)
+    await __cancel(message=message, state=state, delete_delay_sec=1)
 
 
 async def _validate_action_pause(
@@ -346,12 +349,18 @@ async def _validate_action_resume(
     await state.set_state(state=MyPollsStatesGroup.resume_days)
 
 
-async def __cancel(message: Message, state: FSMContext) -> None:
+async def __cancel(
+    message: Message,
+    state: FSMContext,
+    delete_delay_sec: float = 0,
+) -> None:
     """Обрабатывает команду отмены просмотра опросов."""
     state_data: dict[str, any] = await state.get_data()
-    await delete_messages_list(
+    await state.clear()
+    main_menu: Message = await command_start(message=message, from_command_start=False)
+    # INFO. Удаляются сообщения формы, отправленные до нового сообщения "Главная".
+    message_cleanup_queue.put(
         chat_id=message.chat.id,
-        messages_ids=list(range(state_data['_init_message_id'], message.message_id + 2)),
+        messages_ids=list(range(state_data['_init_message_id'], main_menu.message_id)),
+        delay_sec=delete_delay_sec,
     )
-    await state.clear()
-    await command_start(message=message, from_command_start=False)
@@ -1,4 +1,3 @@
-from asyncio import sleep as async_sleep
 from aiogram import (
     Router,
     F,
@@ -6,8 +5,8 @@ from aiogram import (
 from aiogram.types import Message
 
 from app.src.utils.auth import IsDeveloper
-from app.src.utils.message import delete_messages_list
-from app.src.utils.redis_app import redis_flushall
+from app.src.utils.message import message_cleanup_queue
+from app.src.utils.redis_app import redis_flushdb
 from app.src.utils.reply_keyboard import RoutersCommands
 
 router: Router = Router()
@@ -21,10 +20,10 @@ async def command_redis_clear(message: Message) -> None:
     """
     Обрабатывает команду "Очистить Redis".
     """
-    redis_flushall()
+    await redis_flushdb()
     await message.answer(text='Redis очищен!')
-    await async_sleep(0.5)
-    await delete_messages_list(
+    message_cleanup_queue.put(
         chat_id=message.chat.id,
         messages_ids=list(range(message.message_id, message.message_id + 2)),
+        delay_sec=0.5,
     )
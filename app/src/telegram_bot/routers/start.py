@@ -1,28 +1,26 @@
-from typing import TYPE_CHECKING
-
 from aiogram import Router
 from aiogram.filters import CommandStart
 from aiogram.types import Message
 
-from app.src.crud.user import user_crud
-from app.src.database.database import async_session_maker
 from app.src.utils.auth import (
     check_if_user_is_admin,
     check_if_user_is_developer,
 )
-from app.src.utils.message import delete_messages_list
+from app.src.utils.message import message_cleanup_queue
 from app.src.utils.reply_keyboard import get_keyboard_main_menu
-
-if TYPE_CHECKING:
-    from app.src.models.user import User
+from app.src.utils.user import user_activity_buffer
 
 router: Router = Router()
 
 
 @router.message(CommandStart())
-async def command_start(message: Message, from_command_start: bool = True) -> None:
+async def command_start(
+    message: Message,
+    from_command_start: bool = True,
+) -> Message:
     """
     Обрабатывает команду /start и регистрирует/обновляет пользователя.
+    Возвращает отправленное сообщение "Главная".
     """
     text: str = (
         '👋 Привет! Я — Сергей Пилипчак — танцор, преподаватель и создатель онлайн-курсов, '
@@ -50,7 +48,7 @@ async def command_start(message: Message, from_command_start: bool = True) -> No
         )
 
     if from_command_start:
-        await delete_messages_list(
+        message_cleanup_queue.put(
             chat_id=message.chat.id,
             messages_ids=[message.message_id],
         )
@@ -59,37 +57,22 @@ async def command_start(message: Message, from_command_start: bool = True) -> No
         reply_markup=await get_keyboard_main_menu(user_id_telegram=message.from_user.id),
     )
 
-    async with async_session_maker() as session:
-        user: User | None = await user_crud.retrieve_by_id_telegram(
-            obj_id_telegram=message.from_user.id,
-            session=session,
-        )
-        if not user:
-            user: User = await user_crud.create(
-                obj_data={
-                    'id_telegram': str(message.from_user.id),
-                    'message_main_last_id': answer.message_id,
-                    'name_first': message.from_user.first_name,
-                    'name_last': message.from_user.last_name,
-                    'username': message.from_user.username,
-                },
-                session=session,
-                perform_commit=False,
-            )
-        else:
-            await delete_messages_list(
-                chat_id=message.chat.id,
-                messages_ids=[user.message_main_last_id],
-            )
-        await user_crud.update_by_id(
-            obj_id=user.id,
-            obj_data={
-                'datetime_stop': None,
-                'is_stopped_bot': False,
-                'message_main_last_id': answer.message_id,
-                'name_first': message.from_user.first_name,
-                'name_last': message.from_user.last_name,
-                'username': message.from_user.username,
-            },
-            session=session,
+    message_main_last_id_previous: int | None = await user_activity_buffer.save(
+        obj_data={
+            'datetime_stop': None,
+            'id_telegram': message.from_user.id,
+            'is_stopped_bot': False,
+            'message_main_last_id': answer.message_id,
+            'name_first': message.from_user.first_name,
+            'name_last': message.from_user.last_name,
+            'username': message.from_user.username,
+        },
+    )
+
+    if message_main_last_id_previous is not None:
+        message_cleanup_queue.put(
+            chat_id=message.chat.id,
+            messages_ids=[message_main_last_id_previous],
         )
+
+    return answer
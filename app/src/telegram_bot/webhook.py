@@ -0,0 +1,92 @@
+"""
+Модуль приема обновлений Telegram через webhook.
+"""
+
+import logging
+from asyncio import Event
+from secrets import compare_digest
+
+from aiogram.types import Update
+from aiogram.webhook.aiohttp_server import setup_application
+from aiohttp import web
+from pydantic import ValidationError
+
+from app.src.config.config import settings
+from app.src.telegram_bot.bot import bot
+from app.src.telegram_bot.dispatcher import dp
+from app.src.telegram_bot.lifecycle import run_until_stop_signal
+from app.src.telegram_bot.processor import update_processor
+
+# INFO. Заголовок, в котором Telegram передает WEBHOOK_SECRET.
+SECRET_TOKEN_HEADER: str = 'X-Telegram-Bot-Api-Secret-Token'
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+async def handle_webhook_request(request: web.Request) -> web.Response:
+    """
+    Принимает обновление от Telegram и передает его в update_processor.
+
+    Ответ отправляется сразу после постановки обновления в очередь
+    (при UPDATE_OVERFLOW_POLICY=defer - после освобождения места в ней).
+    Если обновление отброшено, Telegram получает ответ 503
+    и повторит отправку обновления позже.
+    """
+    if settings.WEBHOOK_SECRET and not compare_digest(
+        request.headers.get(SECRET_TOKEN_HEADER, '').encode(),
+        settings.WEBHOOK_SECRET.encode(),
+    ):
+        return web.Response(status=401)
+
+    try:
+        update: Update = Update.model_validate(await request.json(), context={'bot': bot})
+    except (ValueError, ValidationError):
+        return web.Response(status=400)
+
+    if not await update_processor.submit(update=update):
+        return web.Response(status=503)
+    return web.Response()
+
+
+async def __on_startup(app: web.Application) -> None:
+    """
+    Регистрирует webhook в Telegram.
+
+    Если WEBHOOK_BASE_URL не указан, webhook не регистрируется: так обновления
+    можно отправлять на сервер вручную, например, при локальной проверке.
+    """
+    if settings.WEBHOOK_BASE_URL:
+        await bot.set_webhook(
+            url=settings.WEBHOOK_BASE_URL.rstrip('/') + settings.WEBHOOK_PATH,
+            secret_token=settings.WEBHOOK_SECRET or None,
+            allowed_updates=dp.resolve_used_update_types(),
+        )
+
+
+def create_webhook_app() -> web.Application:
+    """
+    Создает aiohttp приложение для приема обновлений через webhook.
+    """
+    app: web.Application = web.Application()
+    app.router.add_post(settings.WEBHOOK_PATH, handle_webhook_request)
+    # INFO. Обновления начинают приниматься после запуска dp (см. on_startup dp).
+    setup_application(app, dp, bot=bot)
+    app.on_startup.append(__on_startup)
+    return app
+
+
+async def run_webhook() -> None:
+    """
+    Запускает aiohttp сервер приема обновлений через webhook
+    и останавливает его по сигналу SIGINT или SIGTERM.
+    """
+    runner: web.AppRunner = web.AppRunner(create_webhook_app())
+    await runner.setup()
+    site: web.TCPSite = web.TCPSite(runner, host=settings.WEBHOOK_HOST, port=settings.WEBHOOK_PORT)
+    await site.start()
+    logger.info('Webhook сервер запущен на %s:%s', settings.WEBHOOK_HOST, settings.WEBHOOK_PORT)
+    try:
+        await run_until_stop_signal(Event().wait())
+    finally:
+        await runner.cleanup()
+        await bot.session.close()
@@ -4,6 +4,16 @@ from aiogram.types import Message
 from app.src.config.config import settings
 
 
+class UserRoles:
+    """
+    Класс представления ролей пользователей.
+    """
+
+    ADMIN: str = 'admin'
+    DEVELOPER: str = 'developer'
+    USER: str = 'user'
+
+
 class IsAdmin(Filter):
     """
     Фильтр доступа для администраторов.
@@ -34,3 +44,14 @@ def check_if_user_is_developer(user_id_telegram: int | str) -> bool:
     Проверяет, является ли пользователь разработчиком.
     """
     return str(user_id_telegram) in settings.BOT_DEVELOPER_IDS
+
+
+def get_user_role(user_id_telegram: int | str) -> str:
+    """
+    Возвращает роль пользователя.
+    """
+    if check_if_user_is_developer(user_id_telegram=user_id_telegram):
+        return UserRoles.DEVELOPER
+    elif check_if_user_is_admin(user_id_telegram=user_id_telegram):
+        return UserRoles.ADMIN
+    return UserRoles.USER
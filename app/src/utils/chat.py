@@ -3,38 +3,21 @@ from app.src.database.database import (
     RedisKeys,
     async_session_maker,
 )
-from app.src.models.chat import Chat
 from app.src.utils.redis_app import (
     redis_get,
-    redis_set,
+    redis_set_many,
 )
 
-# TODO. Добавить кеш в Redis!
-
 
 async def get_chat_all_titles() -> list[str]:
     """
     Возвращает список всех названий чатов.
     """
-    all_chat_titles: None | dict[list[dict[str, any]]] = redis_get(key=RedisKeys.CHAT_ALL_TITLES)
+    all_chat_titles: None | dict[list[dict[str, any]]] = await redis_get(key=RedisKeys.CHAT_ALL_TITLES)
     if isinstance(all_chat_titles, dict):
         return all_chat_titles['all_chats']
 
-    async with async_session_maker() as session:
-        chats: list[Chat | None] = await chat_crud.retrieve_all(session=session)
-
-    if len(chats) == 0:
-        redis_set(
-            key=RedisKeys.CHAT_ALL_TITLES,
-            value={'all_chats': []},
-        )
-
-    all_chat_titles: list[str] = [c.title for c in chats]
-    redis_set(
-        key=RedisKeys.CHAT_ALL_TITLES,
-        value={'all_chats': all_chat_titles},
-    )
-
+    all_chat_titles, _ = await __cache_chats()
     return all_chat_titles
 
 
@@ -42,17 +25,29 @@ async def get_chat_id_by_title(title: str) -> int:
     """
     Возвращает ID чата по названию.
     """
-    all_chat_ids: dict[str, int] | None = redis_get(key=RedisKeys.CHAT_ALL_IDS)
+    all_chat_ids: dict[str, int] | None = await redis_get(key=RedisKeys.CHAT_ALL_IDS)
 
     if all_chat_ids is None:
+        _, all_chat_ids = await __cache_chats()
 
-        async with async_session_maker() as session:
-            chats: list[Chat | None] = await chat_crud.retrieve_all(session=session)
-        all_chat_ids: dict[str, int] = {c.title: c.chat_id for c in chats}
+    return all_chat_ids[title]
 
-        redis_set(
-            key=RedisKeys.CHAT_ALL_IDS,
-            value=all_chat_ids,
-        )
 
-    return all_chat_ids[title]
+async def __cache_chats() -> tuple[list[str], dict[str, int]]:
+    """
+    Получает все чаты из базы данных и сохраняет в Redis
+    списки их названий и ID одним запросом.
+    """
+    async with async_session_maker() as session:
+        chats: list[tuple[str, str]] = await chat_crud.retrieve_columns('title', 'chat_id', session=session)
+
+    all_chat_titles: list[str] = [title for title, _ in chats]
+    all_chat_ids: dict[str, int] = {title: chat_id for title, chat_id in chats}
+    await redis_set_many(
+        data={
+            RedisKeys.CHAT_ALL_TITLES: {'all_chats': all_chat_titles},
+            RedisKeys.CHAT_ALL_IDS: all_chat_ids,
+        },
+    )
+
+    return all_chat_titles, all_chat_ids
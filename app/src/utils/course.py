@@ -1,20 +1,130 @@
+from asyncio import Lock
 from typing import TYPE_CHECKING
 
+from aiogram.utils.text_decorations import markdown_decoration
+
 from app.src.crud.course import course_crud
 from app.src.database.database import async_session_maker
 
 if TYPE_CHECKING:
+    from multiprocessing.sharedctypes import Synchronized
+
     from app.src.models.course import Course
 
 
+class CourseCatalog:
+    """
+    Класс представления каталога курсов в памяти процесса.
+
+    Каталог загружается из базы данных один раз при первом обращении
+    и хранится до вызова invalidate(). Каждый вызов invalidate() увеличивает
+    version, по которой зависимые кеши определяют необходимость перестроения.
+
+    Помимо полей курса, каталог хранит готовые к отправке тексты
+    в MarkdownV2 (см. __build_presentation), поэтому показ курса
+    не требует запросов к базе данных.
+
+    В многопроцессном режиме (supervisor.py) процессы используют общий счетчик
+    версий (см. share_version): invalidate() в одном процессе приводит
+    к перезагрузке каталога во всех процессах при следующем обращении.
+    """
+
+    def __init__(self):
+        self.version: int = 0
+        self._courses_by_id: dict[int, dict[str, any]] = {}
+        self._courses_by_title: dict[str, dict[str, any]] = {}
+        self._is_loaded: bool = False
+        self._lock: Lock = Lock()
+        self._shared_version: Synchronized | None = None
+        self._shared_version_seen: int = 0
+        self._titles: frozenset[str] = frozenset()
+
+    async def get_courses(self) -> list[dict[str, any]]:
+        """Возвращает список всех курсов в порядке добавления."""
+        await self.load()
+        return list(self._courses_by_title.values())
+
+    async def get_course_by_id(self, course_id: int) -> dict[str, any] | None:
+        """Возвращает курс по id."""
+        await self.load()
+        return self._courses_by_id.get(course_id)
+
+    async def get_course_by_title(self, title: str) -> dict[str, any] | None:
+        """Возвращает курс по названию."""
+        await self.load()
+        return self._courses_by_title.get(title)
+
+    async def has_title(self, title: str | None) -> bool:
+        """Проверяет, существует ли курс с указанным названием."""
+        await self.load()
+        return title in self._titles
+
+    def invalidate(self) -> None:
+        """Помечает каталог устаревшим. Будет перезагружен при следующем обращении."""
+        self.version += 1
+        self._is_loaded = False
+        if self._shared_version is not None:
+            with self._shared_version.get_lock():
+                self._shared_version.value += 1
+
+    async def load(self) -> None:
+        """Загружает все курсы из базы данных, если каталог устарел."""
+        if self._shared_version is not None and self._shared_version.value != self._shared_version_seen:
+            self._shared_version_seen = self._shared_version.value
+            self.version += 1
+            self._is_loaded = False
+
+        if self._is_loaded:
+            return
+
+        async with self._lock:
+            if self._is_loaded:
+                return
+
+            version: int = self.version
+            async with async_session_maker() as session:
+                courses: list[Course] = await course_crud.retrieve_all(limit=None, session=session)
+
+            self._courses_by_id = {c.id: self.__build_presentation(course=c) for c in courses}
+            self._courses_by_title = {c['title']: c for c in self._courses_by_id.values()}
+            self._titles = frozenset(self._courses_by_title)
+            # INFO. Если каталог инвалидировали во время загрузки,
+            #       то загруженные данные могут быть неактуальны.
+            self._is_loaded = version == self.version
+
+    def share_version(self, *, shared_version: 'Synchronized') -> None:
+        """
+        Подключает общий для нескольких процессов счетчик версий каталога.
+        """
+        self._shared_version = shared_version
+        self._shared_version_seen = shared_version.value
+
+    @staticmethod
+    def __build_presentation(course: 'Course') -> dict[str, any]:
+        """
+        Возвращает словарь курса, дополненный готовыми к отправке текстами:
+            - caption: подпись к картинке курса (описание)
+            - admin_preview_text: тарифы и координаты на клавиатуре
+              для просмотра курса в панели управления
+        """
+        data: dict[str, any] = course.to_dict_repr()
+        data['caption'] = data['description']
+        data['admin_preview_text'] = (
+            f'{data["tariffs"]}'
+            '\n\n'
+            f'{markdown_decoration.quote("координаты на клавиатуре: " + data["keyboard_coordinates"])}'
+        )
+        return data
+
+
+course_catalog: CourseCatalog = CourseCatalog()
+
+
 async def get_all_courses_for_keyboard() -> dict[str, str]:
     """Возвращает словарь названий курсов и их координат на клавиатуре."""
-    async with async_session_maker() as session:
-        courses: list[Course] = await course_crud.retrieve_all(session=session)
-    return {c.title: c.keyboard_coordinates for c in courses}
+    return {c['title']: c['keyboard_coordinates'] for c in await course_catalog.get_courses()}
 
 
 async def get_all_courses_titles() -> list[str | None]:
     """Возвращает список названий курсов."""
-    async with async_session_maker() as session:
-        return [c.title for c in await course_crud.retrieve_all(session=session)]
+    return [c['title'] for c in await course_catalog.get_courses()]
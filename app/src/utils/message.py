@@ -1,11 +1,118 @@
+import logging
+from asyncio import (
+    CancelledError,
+    Event,
+    Task,
+    create_task,
+    gather,
+    get_running_loop,
+    wait_for,
+)
+from heapq import (
+    heappop,
+    heappush,
+)
+from itertools import count
+
 from aiogram.exceptions import (
     TelegramBadRequest,
     TelegramForbiddenError,
 )
 from aiogram.methods.delete_message import DeleteMessage
+from aiogram.methods.delete_messages import DeleteMessages
 
 from app.src.telegram_bot.bot import bot
 
+# INFO. Ограничение Telegram Bot API на количество сообщений в DeleteMessages.
+DELETE_MESSAGES_CHUNK_SIZE: int = 100
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class MessageCleanupQueue:
+    """
+    Класс очереди отложенного удаления сообщений.
+
+    Задания (время удаления, chat_id, ID сообщений) хранятся в куче по времени
+    удаления. Одна фоновая задача дожидается ближайшего задания и удаляет все
+    наступившие сообщения, объединяя сообщения одного чата в один запрос.
+    Обработчикам не нужно ждать удаления: они ставят задание и сразу завершаются.
+    """
+
+    def __init__(self):
+        self._counter: count = count()
+        self._heap: list[tuple[float, int, int, list[int]]] = []
+        self._task: Task | None = None
+        self._wakeup: Event = Event()
+
+    def put(
+        self,
+        *,
+        chat_id: int,
+        messages_ids: list[int],
+        delay_sec: float = 0,
+    ) -> None:
+        """
+        Ставит сообщения в очередь на удаление через delay_sec секунд.
+        """
+        delete_at: float = get_running_loop().time() + delay_sec
+        heappush(self._heap, (delete_at, next(self._counter), chat_id, list(messages_ids)))
+        if self._heap[0][0] == delete_at:
+            self._wakeup.set()
+
+    def start(self) -> None:
+        """Запускает фоновую задачу удаления сообщений."""
+        if self._task is None:
+            self._task = create_task(self.__run())
+
+    async def stop(self) -> None:
+        """Останавливает фоновую задачу и сразу удаляет все сообщения из очереди."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except CancelledError:
+                pass
+            self._task = None
+        await self.__delete_due(until=float('inf'))
+
+    async def __run(self) -> None:
+        """Дожидается ближайшего задания и удаляет наступившие сообщения."""
+        while True:
+            self._wakeup.clear()
+            if not self._heap:
+                await self._wakeup.wait()
+                continue
+
+            timeout: float = self._heap[0][0] - get_running_loop().time()
+            if timeout > 0:
+                try:
+                    await wait_for(self._wakeup.wait(), timeout=timeout)
+                    continue
+                except TimeoutError:
+                    pass
+
+            await self.__delete_due(until=get_running_loop().time())
+
+    async def __delete_due(self, until: float) -> None:
+        """Удаляет сообщения, время удаления которых наступило к моменту until."""
+        chats: dict[int, list[int]] = {}
+        while self._heap and self._heap[0][0] <= until:
+            _, _, chat_id, messages_ids = heappop(self._heap)
+            chats.setdefault(chat_id, []).extend(messages_ids)
+
+        results: list[None | BaseException] = await gather(
+            *(
+                delete_messages_list(chat_id=chat_id, messages_ids=messages_ids)
+                for chat_id, messages_ids
+                in chats.items()
+            ),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error('Не удалось удалить сообщения: %s', result)
+
 
 async def delete_messages_list(
     chat_id: int,
@@ -14,21 +121,64 @@ async def delete_messages_list(
 ) -> None:
     """
     Удаляет указанные сообщения в телеграм чате/группе.
+
+    Сообщения удаляются пачками до 100 штук одним запросом DeleteMessages.
+    Если пачку удалить не удалось, то ее сообщения удаляются
+    конкурентно по одному запросами DeleteMessage.
     """
-    messages_ids.reverse()
-    for message_id in messages_ids:
+    messages_ids: list[int] = sorted({i for i in messages_ids if i is not None})
+    for start in range(0, len(messages_ids), DELETE_MESSAGES_CHUNK_SIZE):
+        chunk: list[int] = messages_ids[start:start + DELETE_MESSAGES_CHUNK_SIZE]
         try:
-            await bot(
-                DeleteMessage(
-                    chat_id=chat_id,
-                    message_id=message_id,
-                ),
-            )
+            if len(chunk) == 1:
+                await bot(DeleteMessage(chat_id=chat_id, message_id=chunk[0]))
+            else:
+                await bot(DeleteMessages(chat_id=chat_id, message_ids=chunk))
         except TelegramForbiddenError:
             if raise_exception:
                 raise
             return
         except TelegramBadRequest:
+            if len(chunk) == 1:
+                if raise_exception:
+                    raise
+                continue
+            if not await __delete_messages_one_by_one(
+                chat_id=chat_id,
+                messages_ids=chunk,
+                raise_exception=raise_exception,
+            ):
+                return
+
+
+async def __delete_messages_one_by_one(
+    chat_id: int,
+    messages_ids: list[int],
+    raise_exception: bool,
+) -> bool:
+    """
+    Конкурентно удаляет сообщения по одному.
+    Возвращает False, если боту запрещен доступ к чату.
+    """
+    results: list[bool | BaseException] = await gather(
+        *(
+            bot(DeleteMessage(chat_id=chat_id, message_id=message_id))
+            for message_id
+            in messages_ids
+        ),
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, TelegramForbiddenError):
             if raise_exception:
-                raise
-            continue
+                raise result
+            return False
+        elif isinstance(result, TelegramBadRequest):
+            if raise_exception:
+                raise result
+        elif isinstance(result, BaseException):
+            raise result
+    return True
+
+
+message_cleanup_queue: MessageCleanupQueue = MessageCleanupQueue()
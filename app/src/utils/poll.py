@@ -1,4 +1,18 @@
-from datetime import timedelta
+import logging
+from asyncio import (
+    Semaphore,
+    gather,
+)
+from datetime import (
+    date,
+    datetime,
+    time,
+    timedelta,
+)
+from typing import (
+    Callable,
+    Iterable,
+)
 from zoneinfo import ZoneInfo
 
 from aiogram.methods import (
@@ -6,56 +20,207 @@ from aiogram.methods import (
     StopPoll,
 )
 from aiogram.types import Message
+from apscheduler.job import Job
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.date import DateTrigger
+from sqlalchemy import func as sql_func
 
 from app.src.crud.poll import poll_crud
-from app.src.config.config import TimeIntervals
+from app.src.config.config import (
+    TimeIntervals,
+    settings,
+)
 from app.src.database.database import async_session_maker
 from app.src.scheduler.scheduler import scheduler
 from app.src.models.poll import Poll
 from app.src.telegram_bot.bot import bot
 from app.src.utils.date import get_today_datetime_data
 
+logger: logging.Logger = logging.getLogger(__name__)
+
 
-def create_poll_schedule_id(poll: Poll, day: str) -> str:
+def create_poll_schedule_id(poll: Poll, day: str | None = None) -> str:
     """
     Создает id задачи для отправки опроса в APIScheduler.
+
+    Если day не указан, то создает id задачи для всех дней недели опроса.
     """
+    if day is None:
+        return f'Send poll id={poll.id}'
     return f'Send poll id={poll.id}, day={day}, hour={poll.send_time.hour}, minute={poll.send_time.minute}'
 
 
+def create_polls_schedule_id(day: str, send_time: time) -> str:
+    """
+    Создает id задачи для отправки всех опросов дня недели и времени в APIScheduler.
+    """
+    return f'Send polls day={day}, hour={send_time.hour}, minute={send_time.minute}'
+
+
 async def get_all_polls_titles() -> list[str]:
     """
     Возвращает список всех названий опросов.
     """
     async with async_session_maker() as session:
-        return [p.title for p in await poll_crud.retrieve_all(session=session)]
+        return [title for title, in await poll_crud.retrieve_columns('title', session=session)]
+
+
+def get_poll_schedule_jobs(polls: Iterable[Poll]) -> dict[str, dict[str, any]]:
+    """
+    Возвращает ожидаемые задачи cron отправки опросов в APIScheduler
+    в виде словаря {id задачи: параметры scheduler.add_job}.
+
+    В режиме POLL_SCHEDULE_MODE=poll создается задача на каждый опрос
+    (со всеми его днями недели), в режиме POLL_SCHEDULE_MODE=day - на каждый
+    опрос и день недели, в режиме POLL_SCHEDULE_MODE=minute - на каждые
+    день недели и время отправки.
+    """
+    jobs: dict[str, dict[str, any]] = {}
+    for poll in sorted(polls, key=lambda p: p.id):
+        __add_poll_schedule_jobs(jobs=jobs, poll=poll)
+    return jobs
+
+
+def __add_poll_schedule_jobs(jobs: dict[str, dict[str, any]], poll: Poll) -> None:
+    """
+    Добавляет в jobs ожидаемые задачи cron отправки опроса (см. get_poll_schedule_jobs).
+    Опросы должны добавляться в порядке id.
+    """
+    if not poll.send_days_of_week_list:
+        return
+
+    if settings.POLL_SCHEDULE_MODE == 'poll':
+        schedule: list[tuple[str, str, Callable, dict[str, any]]] = [(
+            create_poll_schedule_id(poll=poll),
+            ','.join(poll.send_days_of_week_list),
+            poll_send,
+            {'poll_id': poll.id},
+        )]
+    elif settings.POLL_SCHEDULE_MODE == 'day':
+        schedule: list[tuple[str, str, Callable, dict[str, any]]] = [
+            (create_poll_schedule_id(poll=poll, day=day), day, poll_send, {'poll_id': poll.id})
+            for day
+            in poll.send_days_of_week_list
+        ]
+    else:
+        schedule: list[tuple[str, str, Callable, dict[str, any]]] = [
+            (create_polls_schedule_id(day=day, send_time=poll.send_time), day, polls_send, {'polls_ids': []})
+            for day
+            in poll.send_days_of_week_list
+        ]
+
+    for job_id, day_of_week, func, kwargs in schedule:
+        job: dict[str, any] = jobs.setdefault(
+            job_id,
+            {
+                'trigger': CronTrigger(
+                    day_of_week=day_of_week,
+                    hour=poll.send_time.hour,
+                    minute=poll.send_time.minute,
+                    timezone=ZoneInfo("Europe/Moscow"),
+                ),
+                'func': func,
+                'kwargs': kwargs,
+                'misfire_grace_time': TimeIntervals.SECONDS_IN_1_MINUTE * 30,
+            },
+        )
+        if 'polls_ids' in job['kwargs']:
+            job['kwargs']['polls_ids'].append(poll.id)
 
 
 async def poll_send(poll_id: int) -> None:
     """
     Отправляет опрос в телеграм чат/группу.
+
+    Используется задачами, созданными в режимах POLL_SCHEDULE_MODE=day и POLL_SCHEDULE_MODE=poll.
+    """
+    await polls_send(polls_ids=[poll_id])
+
+
+async def polls_send(polls_ids: list[int]) -> None:
+    """
+    Отправляет опросы в телеграм чаты/группы.
+
+    Опросы загружаются одним запросом, отправляются конкурентно
+    (не более POLL_SEND_CONCURRENCY одновременно), а изменения
+    всех опросов сохраняются одним запросом UPDATE.
     """
     async with async_session_maker() as session:
-        poll: Poll = await poll_crud.retrieve_by_id(
-            obj_id=poll_id,
+        polls: list[Poll] = await poll_crud.retrieve_by_ids(
+            objs_ids=polls_ids,
             session=session,
         )
 
     now_datetime, now_today_date, now_today_date_str, *_ = get_today_datetime_data()
 
-    if poll.last_send_date == now_today_date_str:
+    polls: list[Poll] = [p for p in polls if p.last_send_date != now_today_date]
+    if not polls:
         return
 
-    obj_data: dict[str, any] = {'last_send_date': now_today_date}
+    semaphore: Semaphore = Semaphore(settings.POLL_SEND_CONCURRENCY)
+    results: list[dict[str, any] | None | BaseException] = await gather(
+        *(
+            __poll_send(
+                poll=poll,
+                semaphore=semaphore,
+                now_datetime=now_datetime,
+                now_today_date=now_today_date,
+                now_today_date_str=now_today_date_str,
+            )
+            for poll
+            in polls
+        ),
+        return_exceptions=True,
+    )
+
+    sent_objs_data: list[dict[str, any]] = []
+    skipped_objs_data: list[dict[str, any]] = []
+    for poll, result in zip(polls, results):
+        if isinstance(result, BaseException):
+            logger.error('Не удалось отправить опрос id=%s: %s', poll.id, result)
+        elif result is None:
+            skipped_objs_data.append({'id': poll.id})
+        else:
+            sent_objs_data.append(result)
+
+    async with async_session_maker() as session:
+        # INFO. Дата пропуска удаляется из dates_skip в запросе к базе данных,
+        #       чтобы не перезаписать даты, измененные во время отправки опросов.
+        await poll_crud.bulk_update_by_column(
+            column_name='id',
+            objs_data=skipped_objs_data,
+            column_values={
+                'dates_skip': sql_func.array_remove(Poll.dates_skip, now_today_date_str),
+                'is_blocked': True,
+                'last_send_date': now_today_date,
+            },
+            session=session,
+            perform_commit=False,
+        )
+        await poll_crud.bulk_update_by_column(
+            column_name='id',
+            objs_data=sent_objs_data,
+            session=session,
+            perform_commit=False,
+        )
+        await session.commit()
 
+
+async def __poll_send(
+    poll: Poll,
+    semaphore: Semaphore,
+    now_datetime: datetime,
+    now_today_date: date,
+    now_today_date_str: str,
+) -> dict[str, any] | None:
+    """
+    Отправляет один опрос и возвращает его изменения для сохранения в базу данных.
+    Возвращает None, если опрос пропущен (сегодняшняя дата в dates_skip).
+    """
     if now_today_date_str in poll.dates_skip:
-        obj_data.update({
-            'dates_skip': [d for d in poll.dates_skip if d != now_today_date_str],
-            'is_blocked': True,
-        })
-    else:
+        return None
+
+    async with semaphore:
         message: Message = await bot(
             SendPoll(
                 chat_id=poll.chat_id,
@@ -65,24 +230,20 @@ async def poll_send(poll_id: int) -> None:
                 allows_multiple_answers=poll.is_allows_multiple_answers,
             ),
         )
-        obj_data.update({
-            'is_blocked': False,
-            'message_id': str(message.message_id),
-        })
-        scheduler.add_job(
-            id=f'Block poll id={poll.id}, day={1}',
-            trigger=DateTrigger(run_date=now_datetime + timedelta(hours=poll.block_answer_delta_hours)),
-            func=poll_block,
-            kwargs={'poll_id': poll.id},
-            misfire_grace_time=TimeIntervals.SECONDS_IN_1_MINUTE * 30,
-        )
-
-    async with async_session_maker() as session:
-        await poll_crud.update_by_id(
-            obj_id=poll_id,
-            obj_data=obj_data,
-            session=session,
-        )
+    scheduler.add_job(
+        id=f'Block poll id={poll.id}, day={1}',
+        trigger=DateTrigger(run_date=now_datetime + timedelta(hours=poll.block_answer_delta_hours)),
+        func=poll_block,
+        kwargs={'poll_id': poll.id},
+        misfire_grace_time=TimeIntervals.SECONDS_IN_1_MINUTE * 30,
+        replace_existing=True,
+    )
+    return {
+        'id': poll.id,
+        'is_blocked': False,
+        'last_send_date': now_today_date,
+        'message_id': str(message.message_id),
+    }
 
 
 async def poll_block(poll_id: int) -> None:
@@ -113,25 +274,77 @@ async def poll_block(poll_id: int) -> None:
         )
 
 
-def schedule_poll_sending(poll: Poll, specific_day: str | None = None) -> None:
+def schedule_poll_sending(poll: Poll) -> None:
     """
     Создает задачу для cron отправки опроса в APIScheduler.
 
-    Если указан specific_day, то создает задачу только для этого дня.
+    В режиме POLL_SCHEDULE_MODE=minute опрос добавляется в задачу
+    своих дня недели и времени, если она уже существует.
     """
+    for job_id, job_params in get_poll_schedule_jobs(polls=[poll]).items():
+        job: Job | None = scheduler.get_job(job_id=job_id)
+        if job is None:
+            scheduler.add_job(id=job_id, **job_params)
+        elif 'polls_ids' in job.kwargs and poll.id not in job.kwargs['polls_ids']:
+            job.modify(kwargs={'polls_ids': sorted([*job.kwargs['polls_ids'], poll.id])})
+
+
+async def sync_poll_schedule_jobs() -> list[str]:
+    """
+    Приводит задачи cron отправки опросов в APIScheduler в соответствие
+    с опросами в базе данных и режимом POLL_SCHEDULE_MODE.
+    Возвращает список изменений.
+
+    Задачи, созданные в другом режиме (например, "Send poll id=..., day=..."),
+    удаляются и заменяются задачами текущего режима.
+    """
+    changes: list[str] = []
+    jobs: dict[str, Job] = {job.id: job for job in scheduler.get_jobs() if job.id.startswith('Send poll')}
+    expected_jobs: dict[str, dict[str, any]] = {}
+    async with async_session_maker() as session:
+        async for poll in poll_crud.iter_all(session=session):
+            __add_poll_schedule_jobs(jobs=expected_jobs, poll=poll)
+
+    for expected_schedule_id, job_params in expected_jobs.items():
+        job: Job | None = jobs.pop(expected_schedule_id, None)
+        if job is None:
+            scheduler.add_job(id=expected_schedule_id, **job_params)
+            changes.append(f'Добавлен опрос "{expected_schedule_id}"')
+        elif str(job.trigger) != str(job_params['trigger']):
+            scheduler.remove_job(job_id=expected_schedule_id)
+            scheduler.add_job(id=expected_schedule_id, **job_params)
+            changes.append(f'Обновлен опрос "{expected_schedule_id}"')
+        elif job.kwargs != job_params['kwargs']:
+            job.modify(kwargs=job_params['kwargs'])
+            changes.append(f'Обновлен опрос "{expected_schedule_id}"')
+
+    for job in jobs.values():
+        changes.append(f'Удален опрос "{job.id}"')
+        scheduler.remove_job(job_id=job.id)
+
+    return changes
+
+
+def unschedule_poll_sending(poll: Poll) -> None:
+    """
+    Удаляет опрос из задач cron отправки опросов в APIScheduler
+    (во всех режимах POLL_SCHEDULE_MODE).
+    """
+    job_id: str = create_poll_schedule_id(poll=poll)
+    if scheduler.get_job(job_id=job_id) is not None:
+        scheduler.remove_job(job_id=job_id)
+
     for day in poll.send_days_of_week_list:
-        if specific_day and specific_day != day:
-            continue
+        job_id: str = create_poll_schedule_id(poll=poll, day=day)
+        if scheduler.get_job(job_id=job_id) is not None:
+            scheduler.remove_job(job_id=job_id)
 
-        scheduler.add_job(
-            id=create_poll_schedule_id(poll=poll, day=day),
-            trigger=CronTrigger(
-                day_of_week=day,
-                hour=poll.send_time.hour,
-                minute=poll.send_time.minute,
-                timezone=ZoneInfo("Europe/Moscow"),
-            ),
-            func=poll_send,
-            kwargs={'poll_id': poll.id},
-            misfire_grace_time=TimeIntervals.SECONDS_IN_1_MINUTE * 30,
-        )
+        job_id: str = create_polls_schedule_id(day=day, send_time=poll.send_time)
+        job: Job | None = scheduler.get_job(job_id=job_id)
+        if job is None or poll.id not in job.kwargs['polls_ids']:
+            continue
+        polls_ids: list[int] = [i for i in job.kwargs['polls_ids'] if i != poll.id]
+        if polls_ids:
+            job.modify(kwargs={'polls_ids': polls_ids})
+        else:
+            scheduler.remove_job(job_id=job_id)
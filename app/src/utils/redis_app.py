@@ -3,6 +3,9 @@
 
 Использование хранилища Redis для ручного извлечения и сохранения данных
 осуществляется через функции redis_get и redis_set соответственно.
+
+Для работы с несколькими ключами за один сетевой запрос используются
+функции redis_get_many, redis_set_many и redis_delete_many.
 """
 
 import json
@@ -10,21 +13,30 @@ import json
 from app.src.database.database import redis_engine
 
 
-def redis_delete(key: str) -> None:
+async def redis_delete(key: str) -> None:
     """
     Удаляет данные из Redis по указанному ключу.
     """
-    redis_engine.delete(key)
+    await redis_engine.delete(key)
 
 
-def redis_flushall() -> None:
+async def redis_delete_many(keys: list[str] | tuple[str]) -> None:
     """
-    Удаляет все данные из Redis.
+    Удаляет данные из Redis по указанным ключам за один запрос.
     """
-    redis_engine.flushall()
+    if not keys:
+        return
+    await redis_engine.delete(*keys)
+
 
+async def redis_flushdb() -> None:
+    """
+    Удаляет все данные из базы данных кеша Redis.
+    """
+    await redis_engine.flushdb()
 
-def redis_get(
+
+async def redis_get(
     key: str,
     get_ttl: bool = False,
     default: any = None,
@@ -35,36 +47,81 @@ def redis_get(
 
     Если get_ttl=True, то возвращается TTL в секундах (-1, если ключа не существует).
     """
-    data: any = redis_engine.get(name=key)
-    if data is not None:
-        try:
-            data: any = json.loads(s=data)
-        except json.JSONDecodeError:
-            pass
-    elif default is not None:
-        data: any = default
-
     if get_ttl:
-        return data, redis_engine.ttl(name=key)
-    return data
+        async with redis_engine.pipeline(transaction=False) as pipe:
+            data, ttl = await pipe.get(name=key).ttl(name=key).execute()
+        return __decode(data=data, default=default), ttl
+
+    return __decode(data=await redis_engine.get(name=key), default=default)
 
 
-def redis_get_ttl(key: str) -> int:
+async def redis_get_many(
+    keys: list[str] | tuple[str],
+    default: any = None,
+) -> dict[str, any]:
+    """
+    Извлекает данные из Redis по указанным ключам за один запрос.
+    Возвращает словарь {ключ: данные}, для отсутствующих ключей - default.
+    """
+    if not keys:
+        return {}
+    values: list[str | None] = await redis_engine.mget(keys)
+    return {
+        key: __decode(data=value, default=default)
+        for key, value
+        in zip(keys, values)
+    }
+
+
+async def redis_get_ttl(key: str) -> int:
     """
     Извлекает TTL из Redis по указанному ключу
     (-1, если ключа не существует).
     """
-    return redis_engine.ttl(name=key)
+    return await redis_engine.ttl(name=key)
 
 
-def redis_set(key: str, value: any, ex_sec: int = 10) -> None:
+async def redis_set(key: str, value: any, ex_sec: int = 10) -> None:
     """
     Сохраняет данные в Redis по указанному ключу.
 
     Преобразует тип данных dict в JSON.
     """
-    redis_engine.set(
+    await redis_engine.set(
         name=key,
-        value=json.dumps(value) if isinstance(value, dict) else value,
+        value=__encode(value=value),
         ex=ex_sec,
     )
+
+
+async def redis_set_many(data: dict[str, any], ex_sec: int = 10) -> None:
+    """
+    Сохраняет данные в Redis по указанным ключам за один запрос.
+
+    Преобразует тип данных dict в JSON.
+    """
+    if not data:
+        return
+    async with redis_engine.pipeline(transaction=False) as pipe:
+        for key, value in data.items():
+            pipe.set(name=key, value=__encode(value=value), ex=ex_sec)
+        await pipe.execute()
+
+
+def __decode(data: str | None, default: any) -> any:
+    """
+    Преобразует данные из Redis в типы данных Python.
+    """
+    if data is None:
+        return default
+    try:
+        return json.loads(s=data)
+    except json.JSONDecodeError:
+        return data
+
+
+def __encode(value: any) -> any:
+    """
+    Преобразует данные Python для сохранения в Redis.
+    """
+    return json.dumps(value) if isinstance(value, dict) else value
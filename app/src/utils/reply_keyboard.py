@@ -4,10 +4,16 @@ from aiogram.types import (
 )
 
 from app.src.utils.auth import (
-    check_if_user_is_admin,
-    check_if_user_is_developer,
+    UserRoles,
+    get_user_role,
 )
-from app.src.utils.course import get_all_courses_for_keyboard
+from app.src.utils.course import (
+    course_catalog,
+    get_all_courses_for_keyboard,
+)
+
+# INFO. Кеш клавиатур главного меню: {роль: (версия каталога курсов, клавиатура)}.
+_KEYBOARD_MAIN_MENU_CACHE: dict[str, tuple[int, ReplyKeyboardMarkup]] = {}
 
 
 class RoutersCommands:
@@ -25,6 +31,7 @@ class RoutersCommands:
     DELETE: str = 'Удалить'
 
     # Developer
+    METRICS: str = '⛔️ Метрики'
     REDIS_CLEAR: str = '⛔️ Очистить Redis'
     DELETE_POLL_SCHEDULE: str = '⛔️ Удалить scheduler опросы'
     SYNC_POLL_SCHEDULE: str = '⛔️ Синхронизировать опросы'
@@ -55,8 +62,18 @@ def make_row_keyboard(rows: tuple[tuple[str]]) -> ReplyKeyboardMarkup:
 async def get_keyboard_main_menu(user_id_telegram: int | str) -> ReplyKeyboardMarkup:
     """
     Возвращает клавиатуру главного меню.
+
+    Клавиатуры кешируются для каждой роли пользователя и перестраиваются
+    только при изменении версии каталога курсов.
     """
-    # TODO. Добавить Redis
+    role: str = get_user_role(user_id_telegram=user_id_telegram)
+    await course_catalog.load()
+    version: int = course_catalog.version
+
+    cached: tuple[int, ReplyKeyboardMarkup] | None = _KEYBOARD_MAIN_MENU_CACHE.get(role)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
     courses: dict[str, str] = await get_all_courses_for_keyboard()
     grid: dict[int, list[tuple[int, str]]] = {}
     for title, coordinate in courses.items():
@@ -64,22 +81,24 @@ async def get_keyboard_main_menu(user_id_telegram: int | str) -> ReplyKeyboardMa
         grid.setdefault(row, []).append((col, title))
     keyboard: list[list[str]] = list([title for _, title in sorted(grid[row])] for row in sorted(grid))
 
-    if check_if_user_is_developer(user_id_telegram=user_id_telegram):
+    if role == UserRoles.DEVELOPER:
         keyboard: list[list[str]] = [
-            [RoutersCommands.REDIS_CLEAR],
+            [RoutersCommands.REDIS_CLEAR, RoutersCommands.METRICS],
             [RoutersCommands.SYNC_POLL_SCHEDULE, RoutersCommands.DELETE_POLL_SCHEDULE],
             [RoutersCommands.COURSE_ADD, RoutersCommands.COURSE_MY],
             [RoutersCommands.POLL_ADD, RoutersCommands.POLL_MY],
             *keyboard,
         ]
-    elif check_if_user_is_admin(user_id_telegram=user_id_telegram):
+    elif role == UserRoles.ADMIN:
         keyboard: list[list[str]] = [
             [RoutersCommands.COURSE_ADD, RoutersCommands.COURSE_MY],
             [RoutersCommands.POLL_ADD, RoutersCommands.POLL_MY],
             *keyboard,
         ]
 
-    return make_row_keyboard(rows=keyboard)
+    keyboard_main_menu: ReplyKeyboardMarkup = make_row_keyboard(rows=keyboard)
+    _KEYBOARD_MAIN_MENU_CACHE[role] = (version, keyboard_main_menu)
+    return keyboard_main_menu
 
 KEYBOARD_CANCEL: ReplyKeyboardMarkup = make_row_keyboard(rows=((RoutersCommands.CANCEL,),))
 KEYBOARD_HOME: ReplyKeyboardMarkup = make_row_keyboard(rows=((RoutersCommands.HOME,),))
@@ -0,0 +1,149 @@
+import logging
+from asyncio import (
+    CancelledError,
+    Event,
+    Task,
+    create_task,
+    wait_for,
+)
+from collections import OrderedDict
+
+from app.src.config.config import settings
+from app.src.crud.user import user_crud
+from app.src.database.database import async_session_maker
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class UserActivityBuffer:
+    """
+    Класс буфера отложенной записи активности пользователей.
+
+    Изменения уже известных пользователей накапливаются в памяти (несколько
+    изменений одного пользователя объединяются) и записываются в базу данных
+    одним запросом UPDATE ... FROM (VALUES ...) каждые flush_interval_sec секунд,
+    при накоплении flush_size пользователей и при остановке бота.
+
+    Неизвестный процессу пользователь создается/обновляется сразу одним
+    запросом upsert в отдельной сессии: из базы данных нужно получить его прошлое
+    сообщение "Главная", а пользователь считается известным только после
+    фиксации транзакции (иначе при ее откате он никогда не будет создан).
+    """
+
+    def __init__(
+        self,
+        *,
+        flush_interval_sec: float,
+        flush_size: int,
+        known_users_max: int,
+    ):
+        self.flush_interval_sec: float = flush_interval_sec
+        self.flush_size: int = flush_size
+        self.known_users_max: int = known_users_max
+        self._flush_event: Event = Event()
+        self._message_main_last_ids: OrderedDict[str, int | None] = OrderedDict()
+        self._pending: dict[str, dict[str, any]] = {}
+        self._task: Task | None = None
+
+    async def save(
+        self,
+        *,
+        obj_data: dict[str, any],
+    ) -> int | None:
+        """
+        Сохраняет данные пользователя (obj_data должен содержать id_telegram).
+        Возвращает значение message_main_last_id до сохранения.
+        """
+        id_telegram: str = str(obj_data['id_telegram'])
+
+        if id_telegram not in self._message_main_last_ids:
+            # INFO. Устаревшие изменения не должны перезаписать данные upsert.
+            self._pending.pop(id_telegram, None)
+            async with async_session_maker() as session:
+                _, message_main_last_id_previous = await user_crud.upsert_by_id_telegram(
+                    obj_data=obj_data,
+                    session=session,
+                )
+            self.__remember(id_telegram=id_telegram, obj_data=obj_data)
+            return message_main_last_id_previous
+
+        message_main_last_id_previous: int | None = self._message_main_last_ids[id_telegram]
+        self.__remember(id_telegram=id_telegram, obj_data=obj_data)
+        self._pending.setdefault(id_telegram, {}).update(obj_data, id_telegram=id_telegram)
+        if len(self._pending) >= self.flush_size:
+            self._flush_event.set()
+        return message_main_last_id_previous
+
+    async def flush(self) -> None:
+        """
+        Записывает накопленные изменения в базу данных.
+        При ошибке изменения возвращаются в буфер.
+        """
+        if not self._pending:
+            return
+
+        pending, self._pending = self._pending, {}
+
+        # INFO. Один запрос UPDATE на каждый набор колонок (обычно он один).
+        groups: dict[tuple[str], list[dict[str, any]]] = {}
+        for obj_data in pending.values():
+            groups.setdefault(tuple(sorted(obj_data)), []).append(obj_data)
+
+        try:
+            async with async_session_maker() as session:
+                for objs_data in groups.values():
+                    await user_crud.bulk_update_by_column(
+                        column_name='id_telegram',
+                        objs_data=objs_data,
+                        session=session,
+                        perform_commit=False,
+                    )
+                await session.commit()
+        except Exception:
+            logger.exception('Не удалось записать активность %s пользователей', len(pending))
+            for id_telegram, obj_data in self._pending.items():
+                pending.setdefault(id_telegram, {}).update(obj_data)
+            self._pending = pending
+
+    def start(self) -> None:
+        """Запускает фоновую задачу периодической записи."""
+        if self._task is None:
+            self._task = create_task(self.__run())
+
+    async def stop(self) -> None:
+        """Останавливает фоновую задачу и записывает оставшиеся изменения."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    async def __run(self) -> None:
+        """Записывает изменения по таймеру или по заполнению буфера."""
+        while True:
+            try:
+                await wait_for(self._flush_event.wait(), timeout=self.flush_interval_sec)
+            except TimeoutError:
+                pass
+            self._flush_event.clear()
+            await self.flush()
+
+    def __remember(self, *, id_telegram: str, obj_data: dict[str, any]) -> None:
+        """Запоминает пользователя и его последнее сообщение "Главная"."""
+        self._message_main_last_ids[id_telegram] = obj_data.get(
+            'message_main_last_id',
+            self._message_main_last_ids.get(id_telegram),
+        )
+        self._message_main_last_ids.move_to_end(id_telegram)
+        if len(self._message_main_last_ids) > self.known_users_max:
+            self._message_main_last_ids.popitem(last=False)
+
+
+user_activity_buffer: UserActivityBuffer = UserActivityBuffer(
+    flush_interval_sec=settings.USER_ACTIVITY_FLUSH_INTERVAL_MS / 1000,
+    flush_size=settings.USER_ACTIVITY_FLUSH_SIZE,
+    known_users_max=settings.USER_ACTIVITY_KNOWN_USERS_MAX,
+)